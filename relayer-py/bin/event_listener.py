@@ -31,7 +31,10 @@ def app(chain_id: int, debug: bool = False) -> None:
     )
     
     # Listen events
-    apps(chain_id=chain_id)
+    try:
+        apps(chain_id=chain_id)
+    finally:
+        rr_provider.close()
 
 
 class Parser:
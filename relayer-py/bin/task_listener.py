@@ -55,14 +55,17 @@ def send(
         chain_id=chain_id
     )
 
-    for i in range(int(number)):
-        if message is None:
-            _message = "AttributeDict({'args': AttributeDict({'owner': '0x5a1C4Fb0AE5470B0a502b9395ff30E7292947c11'}), 'event': 'OwnerGet', 'logIndex': 0, 'transactionIndex': 0, 'transactionHash': HexBytes('0x0ab65baf4a54b4656a8747d86bdb46db51ad650cb2a27b3f8a2faea26ebe35b6'), 'address': '0x5816Eb4EAD3006AACbebFA01cE05d6BeE6ED75f4', 'blockHash': HexBytes('0x1458957cbb37c3769f3c2c634b07fd45f9d8608ef34c9e397d3cae7e8fa4347f'), 'blockNumber': 7669498})"
-        else:
-            _message = f"{message}_{i}"
+    try:
+        for i in range(int(number)):
+            if message is None:
+                _message = "AttributeDict({'args': AttributeDict({'owner': '0x5a1C4Fb0AE5470B0a502b9395ff30E7292947c11'}), 'event': 'OwnerGet', 'logIndex': 0, 'transactionIndex': 0, 'transactionHash': HexBytes('0x0ab65baf4a54b4656a8747d86bdb46db51ad650cb2a27b3f8a2faea26ebe35b6'), 'address': '0x5816Eb4EAD3006AACbebFA01cE05d6BeE6ED75f4', 'blockHash': HexBytes('0x1458957cbb37c3769f3c2c634b07fd45f9d8608ef34c9e397d3cae7e8fa4347f'), 'blockNumber': 7669498})"
+            else:
+                _message = f"{message}_{i}"
         
-        event_dto = EventDTO(name="TestEvent", data=_message)
-        app._handle_event(event_dto=event_dto)
+            event_dto = EventDTO(name="TestEvent", data=_message)
+            app._handle_event(event_dto=event_dto)
+    finally:
+        register_provider.close()
 
 def callback(data: Any):
     print(f"handle message here !!! with data: {data}")
@@ -1,7 +1,9 @@
 """Application for the bridge relayer."""
 import asyncio
-import time
-from typing import Any, Dict
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Set
 
 from src.relayer.domain.config import (
     RelayerRegisterConfigDTO,
@@ -16,6 +18,7 @@ from src.relayer.interface.relayer import (
     IRelayerBlockchain,
     IRelayerRegister,
 )
+from src.relayer.domain.exception import BridgeRelayerRegisterEventFailed
 from src.relayer.domain.relayer import BridgeTaskResult, BridgeTaskTxResult
 from src.relayer.domain.relayer import (
     BridgeTaskDTO,
@@ -26,6 +29,62 @@ from src.relayer.config import (
     get_register_config,
 )
 
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+# Max events kept while the register fails, the oldest is dropped beyond
+MAX_PENDING_EVENTS: int = 10_000
+
+@dataclass(frozen=True, slots=True)
+class EventTask:
+    """Contract's function executed for an event received."""
+    
+    func_name: str
+    # Execute on the source chain, otherwise on the target chain
+    on_chain_id_from: bool
+    operation_hash_param: str = "operationHash"
+    wait_block_validation: bool = False
+    # Execute on the second event only of an operation
+    wait_for_pair: bool = False
+    # Send the operator param instead of the block step
+    with_operator: bool = False
+
+
+# Proxy rule to execute smart contract's function, by event name
+EVENT_TASKS: Dict[str, EventTask] = {
+    "OperationCreated": EventTask(
+        func_name="confirmFeesLockedAndDepositConfirmed",
+        on_chain_id_from=True,
+        wait_block_validation=True,
+        wait_for_pair=True,
+    ),
+    "FeesLockedConfirmed": EventTask(
+        func_name="confirmFeesLockedAndDepositConfirmed",
+        on_chain_id_from=True,
+        wait_block_validation=True,
+        wait_for_pair=True,
+    ),
+    "FeesLockedAndDepositConfirmed": EventTask(
+        func_name="completeOperation",
+        on_chain_id_from=False,
+        operation_hash_param="_operationHash",
+    ),
+    "FeesDeposited": EventTask(
+        func_name="sendFeesLockConfirmation",
+        on_chain_id_from=False,
+        wait_block_validation=True,
+    ),
+    "FeesDepositConfirmed": EventTask(
+        func_name="receiveFeesLockConfirmation",
+        on_chain_id_from=True,
+        with_operator=True,
+    ),
+    "OperationFinalized": EventTask(
+        func_name="receivedFinalizedOperation",
+        on_chain_id_from=True,
+    ),
+}
+
+
 class App:
     """Blockchain Bridge Relayer application."""
     
@@ -90,6 +149,11 @@ class ManageEventFromBlockchain:
         self.rr_provider: IRelayerRegister = relayer_register_provider
         self.chain_id: int = chain_id
         self.verbose: bool = verbose
+        # Built once, it registers every event received by the listener
+        self.register_event_app = RegisterEvent(
+            relayer_register_provider=self.rr_provider)
+        # Events not registered yet, registered again before the next event
+        self.pending_events: Deque[bytes] = deque(maxlen=MAX_PENDING_EVENTS)
     
     def __call__(self) -> None:
         """Listen event main function."""
@@ -141,11 +205,33 @@ class ManageEventFromBlockchain:
     def _register_event(self, event: bytes) -> None:
         """Register an event in a queue.
 
+        A register failure does not stop the listener, the event is kept \
+            and registered again, in order, with the next event received. \
+            Up to MAX_PENDING_EVENTS events are kept, the oldest is dropped \
+            beyond.
+
         Args:
-            event (EventDTO): The eventDTO instance
+            event (bytes): The event as bytes format
         """
-        app = RegisterEvent(relayer_register_provider=self.rr_provider)
-        app(event=event)
+        if len(self.pending_events) == self.pending_events.maxlen:
+            LOGGER.error(
+                "Pending events full (%s), the oldest event is dropped: %r",
+                self.pending_events.maxlen,
+                from_bytes(self.pending_events[0]),
+            )
+        self.pending_events.append(event)
+        
+        while self.pending_events:
+            try:
+                self.register_event_app(event=self.pending_events[0])
+            except BridgeRelayerRegisterEventFailed as e:
+                LOGGER.error(
+                    "Register event failed, %s event(s) pending: %s",
+                    len(self.pending_events),
+                    e,
+                )
+                return
+            self.pending_events.popleft()
         
 
 class RegisterEvent:
@@ -192,208 +278,141 @@ class ConsumeEventTask:
         self.rr_provider: IRelayerRegister = relayer_consumer_provider
         self.rb_provider: IRelayerBlockchain = relayer_blockchain_provider
         self.verbose: bool = verbose
-        self.confirm_fees_locked_deposit_event = {}
+        # Operation hashes waiting for their second confirmation event
+        self.confirm_fees_locked_deposit_event: Set[Any] = set()
+        self.blockchain_configs: Dict[int, RelayerBlockchainConfigDTO] = {}
     
     def __call__(self) -> None:
-        """Consumer worker."""
+        """Consumer worker.
+        
+        A read failure is not handled here and stops the worker. The \
+            message being handled is not acknowledged, so RabbitMQ delivers \
+            it again once the worker is restarted. Retrying in place would \
+            loop on a message that always fails.
+
+        Raises:
+            BridgeRelayerReadEventFailed
+        """
         if self.verbose:
             print('[ 💠 ] Waiting for events. To exit press CTRL+C')
             
         self.rr_provider.read_events(callback=self._callback)
 
     def _callback(self, event: bytes) -> None:
-        """"""
+        """Execute the contract's function of the event received.
+
+        Args:
+            event (bytes): The event
+        """
         if self.verbose:
             print(f"[ 📩 ] Received event : {event}")
         
-        # print(f"\n {event}\n")
         event_dto: EventDTO = self._convert_data_from_bytes(event=event)
-        chain_id_from: int = event_dto.data.params.chainIdFrom
-        chain_id_to: int = event_dto.data.params.chainIdTo
-        block_step: int = event_dto.data.blockStep
-
-        # print("\n")
-        # print(f"chain_id_from : {chain_id_from}")
-        # print(f"chain_id_to : {chain_id_to}")
-        # print(f"block_step : {block_step}")
-        # print("\n")
-              
-
-        # Proxy rule to execute smart contract's function
-        if event_dto.name == "OperationCreated" or event_dto.name == "FeesLockedConfirmed":
-            print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
-            func_name = "confirmFeesLockedAndDepositConfirmed"
-            chain_id = chain_id_from
-            
-            self.rb_provider.set_chain_id(chain_id=chain_id)
-            app = ExecuteContractTask(
-                relayer_blockchain_provider=self.rb_provider)
-            
-            params = {
-                "operationHash": event_dto.data.operationHash,
-                "params": event_dto.data.params,
-                "blockStep": event_dto.data.blockStep,
-            }
-                        
-            bridge_task_dto = BridgeTaskDTO(
-                func_name=func_name,
-                params=params
-            )
+        event_task: Optional[EventTask] = EVENT_TASKS.get(event_dto.name)
+        
+        if event_task is None:
+            print(f"[ 🟤 ] Ignore event : {event_dto.name}")
+            if self.verbose:
+                print(f"{50*'- '}")
+            return
             
-            # Check event order 
-            id = event_dto.data.operationHash
-            if self.confirm_fees_locked_deposit_event.get(id) is None:
-                self.confirm_fees_locked_deposit_event[id] = True
+        print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
+        # The event data is read once, not through the event DTO each time
+        event_data: Any = event_dto.data
+        operation_hash: Any = event_data.operationHash
+        event_params: Any = event_data.params
+        
+        # Check event order 
+        if event_task.wait_for_pair:
+            id = operation_hash
+            if id not in self.confirm_fees_locked_deposit_event:
+                self.confirm_fees_locked_deposit_event.add(id)
                 return
             
-            # cleanup mapping 
-            del self.confirm_fees_locked_deposit_event[id]
-                        
-            # Block validation
+            # cleanup pending operations
+            self.confirm_fees_locked_deposit_event.remove(id)
+        
+        if event_task.on_chain_id_from:
+            chain_id: int = event_params.chainIdFrom
+        else:
+            chain_id: int = event_params.chainIdTo
+        
+        self.rb_provider.set_chain_id(chain_id=chain_id)
+        app = ExecuteContractTask(relayer_blockchain_provider=self.rb_provider)
+        
+        params: Dict[str, Any] = {
+            event_task.operation_hash_param: operation_hash,
+            "params": event_params,
+        }
+        if event_task.with_operator:
+            # "operator": event_dto.data.params.operator,
+            params["operator"] = "0x0000000000000000000000000000000000000000"
+        else:
+            params["blockStep"] = event_data.blockStep
+        
+        bridge_task_dto = BridgeTaskDTO(
+            func_name=event_task.func_name,
+            params=params
+        )
+        
+        # Block validation
+        if event_task.wait_block_validation:
             blockchain_config: RelayerBlockchainConfigDTO = \
-                get_blockchain_config(chain_id=chain_id)
-            wait_block_validation = blockchain_config.wait_block_validation
-            block_validated = block_step + wait_block_validation
-            
-            while  asyncio.run(
-                self.rb_provider.get_block_number()) < block_validated:
-                
-                latest_block: int = asyncio.run(
-                    self.rb_provider.get_block_number())
-                
-                print(
-                    f"[ ⏳ ] wait for block validation "
-                    f"{latest_block} -> {block_validated}"
-                )
-                
-                if latest_block >= block_validated:
-                    break
-                time.sleep(1)
-            
-            # Execute task
-            app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
-            
-        elif event_dto.name == "FeesLockedAndDepositConfirmed":
-            print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
-            func_name = "completeOperation"
-            chain_id = chain_id_to
-            
-            self.rb_provider.set_chain_id(chain_id=chain_id)
-            app = ExecuteContractTask(
-                relayer_blockchain_provider=self.rb_provider)
-            
-            params: Dict[str, Any] = {
-                "_operationHash": event_dto.data.operationHash,
-                "params": event_dto.data.params,
-                "blockStep": event_dto.data.blockStep,
-            }
-                        
-            bridge_task_dto = BridgeTaskDTO(
-                func_name=func_name,
-                params=params
-            )
-            
-            # Execute task
-            app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
-            
-        elif event_dto.name == "FeesDeposited":
-            print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
-            func_name = "sendFeesLockConfirmation"
-            chain_id = chain_id_to
+                self._get_blockchain_config(chain_id=chain_id)
+            block_validated: int = event_data.blockStep \
+                + blockchain_config.wait_block_validation
             
-            self.rb_provider.set_chain_id(chain_id=chain_id)
+            asyncio.run(self._wait_for_block_validation(block_validated))
+        
+        # Execute task
+        app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
 
-            app = ExecuteContractTask(
-                relayer_blockchain_provider=self.rb_provider)
-            
-            params: Dict[str, Any] = {
-                "operationHash": event_dto.data.operationHash,
-                "params": event_dto.data.params,
-                "blockStep": event_dto.data.blockStep,
-            }
-
-            bridge_task_dto = BridgeTaskDTO(
-                func_name=func_name,
-                params=params
-            )
-            
-            # Block validation
-            blockchain_config = get_blockchain_config(chain_id=chain_id)
-            wait_block_validation: int = blockchain_config.wait_block_validation
-            block_validated: int = block_step + wait_block_validation
-            
-            while  asyncio.run(
-                self.rb_provider.get_block_number()) < block_validated:
-                
-                latest_block = asyncio.run(self.rb_provider.get_block_number())
-                print(
-                    f"[ ⏳ ] wait for block validation "
-                    f"{latest_block} -> {block_validated}"
-                )
-                
-                if latest_block >= block_validated:
-                    break
-                time.sleep(1)
-            
-            # Execute task
-            app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
-            
-        elif event_dto.name == "FeesDepositConfirmed":
-            print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
-            func_name = "receiveFeesLockConfirmation"
-            chain_id = chain_id_from
-            
-            self.rb_provider.set_chain_id(chain_id=chain_id)
+        if self.verbose:
+            print(f"{50*'- '}")
+        
+    async def _wait_for_block_validation(
+        self, 
+        block_validated: int,
+        poll_interval: int = 1,
+    ) -> None:
+        """Wait until the latest block reaches the validated block.
 
-            app = ExecuteContractTask(
-                relayer_blockchain_provider=self.rb_provider)
-                      
-            params: Dict[str, Any] = {
-                "operationHash": event_dto.data.operationHash,
-                "params": event_dto.data.params,
-                # "operator": event_dto.data.params.operator,
-                "operator": "0x0000000000000000000000000000000000000000",
-            }
-                        
-            bridge_task_dto = BridgeTaskDTO(
-                func_name=func_name,
-                params=params
+        The block number is polled within a single event loop, instead of \
+            one event loop per poll.
+
+        Args:
+            block_validated (int): The block number to reach
+            poll_interval (int, optional): The poll interval in second. \
+                Defaults to 1.
+        """
+        latest_block: int = await self.rb_provider.get_block_number()
+        
+        while latest_block < block_validated:
+            print(
+                f"[ ⏳ ] wait for block validation "
+                f"{latest_block} -> {block_validated}"
             )
-            
-            # Execute task
-            app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
-            
-            
-        elif event_dto.name == "OperationFinalized":
-            print(f"[ 🟡 ] Handle event : {event_dto.name}\n")
-            func_name = "receivedFinalizedOperation"
-            chain_id = chain_id_from
-            
-            self.rb_provider.set_chain_id(chain_id=chain_id)
+            await asyncio.sleep(poll_interval)
+            latest_block = await self.rb_provider.get_block_number()
 
-            app = ExecuteContractTask(
-                relayer_blockchain_provider=self.rb_provider)
-            
-            params: Dict[str, Any] = {
-                "operationHash": event_dto.data.operationHash,
-                "params": event_dto.data.params,
-                "blockStep": event_dto.data.blockStep,
-            }
-                        
-            bridge_task_dto = BridgeTaskDTO(
-                func_name=func_name,
-                params=params
-            )           
-            
-            # Execute task
-            app(chain_id=chain_id, bridge_task_dto=bridge_task_dto)
-            
-        else:
-            print(f"[ 🟤 ] Ignore event : {event_dto.name}")
+    def _get_blockchain_config(
+        self, 
+        chain_id: int
+    ) -> RelayerBlockchainConfigDTO:
+        """Get the blockchain config, read once per chain id.
+
+        Args:
+            chain_id (int): The blockchain id
+
+        Returns:
+            RelayerBlockchainConfigDTO: The blockchain config
+        """
+        blockchain_config = self.blockchain_configs.get(chain_id)
+        if blockchain_config is None:
+            blockchain_config = get_blockchain_config(chain_id=chain_id)
+            self.blockchain_configs[chain_id] = blockchain_config
+        return blockchain_config
 
-        if self.verbose:
-            print(f"{50*'- '}")
-        
     def _convert_data_from_bytes(self, event: bytes) -> EventDTO:
         """Convert attribut data from bytes.
 
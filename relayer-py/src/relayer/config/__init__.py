@@ -1,15 +1,22 @@
 """Bridge relayer configuration."""
+import copy
+import functools
 import json
 import pathlib
 import os
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Set
 from dotenv import load_dotenv
 import tomli
-from jinja2 import Template
 
 from src.relayer.domain.config import RelayerBlockchainConfigDTO, RelayerRegisterConfigDTO
 from src.relayer.domain.exception import BridgeRelayerConfigABIAttributeMissing, BridgeRelayerConfigABIFileMissing, BridgeRelayerConfigBlockchainDataMissing, BridgeRelayerConfigRegisterDataMissing, BridgeRelayerConfigReplacePlaceholderTypeError, BridgeRelayerConfigTOMLFileMissing
 
+if TYPE_CHECKING:  # Only used for type hints, not imported at runtime
+    from jinja2 import Template
+
+# Directory of the config files, resolved once
+CONFIG_DIR = pathlib.Path(__file__).parent
+
 FILE_ABI_DEV = "abi_dev.json"
 FILE_ABI_PRD = "abi.json"
 
@@ -22,6 +29,9 @@ FILE_ENV_PRD = ".env.config.prod"
 # Load .env
 load_dotenv()
 
+# Environments (True for dev, False for prod) whose env files are loaded
+ENV_FILES_LOADED: Set[bool] = set()
+
 
 def is_dev_env() -> bool:
     """Check if environment is dev or prod.
@@ -29,18 +39,30 @@ def is_dev_env() -> bool:
     Returns:
         bool: Return True if environment is Dev, False for Prod
     """
-    if os.environ.get("DEV_ENV") and os.environ["DEV_ENV"] == "False":
-        return False
-    return True
+    # One lookup, os.environ encodes the key and decodes the value on each
+    return os.environ.get("DEV_ENV") != "False"
 
 
 
 def load_env_file():
     """Load env file that depends on environment dev or prod."""
-    if is_dev_env():
+    dev: bool = is_dev_env()
+    if dev:
         load_dotenv(FILE_ENV_DEV)
     
     load_dotenv(FILE_ENV_PRD)
+    ENV_FILES_LOADED.add(dev)
+
+
+def _load_env_file_if_not_loaded() -> None:
+    """Load the env file of the environment if not loaded yet.
+
+    load_dotenv does not override the variables already set, loading the \
+        same files again for each config read would only re-read them. \
+        Clear ENV_FILES_LOADED, or call load_env_file, to read them again.
+    """
+    if is_dev_env() not in ENV_FILES_LOADED:
+        load_env_file()
 
 
 def get_toml_file() -> str:
@@ -52,7 +74,7 @@ def get_toml_file() -> str:
     Returns:
         str: The toml file name
     """
-    load_env_file()
+    _load_env_file_if_not_loaded()
     
     if is_dev_env():
         return FILE_TOML_DEV
@@ -83,16 +105,35 @@ def get_config_content(toml_file: str) -> str:
     Returns:
         str: The toml content file
     """
-    path: pathlib.Path = pathlib.Path(__file__).parent / toml_file
+    path: pathlib.Path = CONFIG_DIR / toml_file
 
     try:
-        with path.open(mode="r") as file:
-            config_content: str = file.read()
-            return config_content
+        # One read of the file bytes decoded as UTF-8, whatever the locale
+        config_content: str = path.read_bytes().decode("utf-8")
+        return config_content
     except FileNotFoundError as e:
         raise BridgeRelayerConfigTOMLFileMissing(e)
     
     
+@functools.lru_cache(maxsize=8)
+def _get_template(config_content: str) -> 'Template':
+    """Get the compiled template of a toml content.
+
+    Compiling a template parses the content and generates Python code, \
+        while the toml files do not change during a relayer session.
+
+    Args:
+        config_content (str): The toml content
+
+    Returns:
+        Template: The compiled template
+    """
+    # jinja2 is imported on the first render, not by every module that 
+    # imports the config.
+    from jinja2 import Template
+    return Template(config_content)
+
+
 def replace_placeholders(config_content: str) -> str:
     """Substitute double curly braces by values.
     
@@ -105,44 +146,81 @@ def replace_placeholders(config_content: str) -> str:
         str: The toml content modified
     """
     try:
-        template = Template(config_content)
+        template: 'Template' = _get_template(config_content)
         rendered_content: str = template.render(os.environ)
         return rendered_content
     except TypeError as e:
         raise BridgeRelayerConfigReplacePlaceholderTypeError(e)
 
 
+@functools.lru_cache(maxsize=4)
+def _get_abis(path: pathlib.Path, mtime_ns: int) -> Dict[int, Any]:
+    """Get the ABIs of an abi file, indexed by chain id.
+
+    The file is parsed once per modification time, the keys that are not \
+        a chain id (e.g. a backup of an abi) are skipped.
+
+    Args:
+        path (pathlib.Path): The abi file path
+        mtime_ns (int): The abi file modification time, in nanoseconds
+
+    Returns:
+        Dict[int, Any]: The ABIs by chain id
+    """
+    # json parses the UTF-8 bytes directly, without a text-mode file
+    abis: Dict[str, Any] = json.loads(path.read_bytes())
+    return {int(k): abi for k, abi in abis.items() if k.isdigit()}
+
+
 def get_abi(chain_id: int) -> Any:
     """Get the ABI content.
 
     Args:
-        chain_id (int): The chain_id
+        chain_id (int): The chain_id, as an int or a numeric str
 
     Returns:
-        Any: The abi
+        Any: The abi, a copy the caller can modify
     """
     abi_file: str = get_abi_file()
-    path: pathlib.Path = pathlib.Path(__file__).parent / abi_file
+    path: pathlib.Path = CONFIG_DIR / abi_file
 
     try:
-        with path.open('r') as f:
-            abi: Any = json.loads(f.read())
-            return abi[str(chain_id)]
+        abis: Dict[int, Any] = _get_abis(path, path.stat().st_mtime_ns)
+        return copy.deepcopy(abis[int(chain_id)])
     except FileNotFoundError as e:
         raise BridgeRelayerConfigABIFileMissing(e)
-    except KeyError as e:
+    except (KeyError, TypeError, ValueError) as e:
         raise BridgeRelayerConfigABIAttributeMissing(e)
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(rendered_content: str) -> Dict[str, Any]:
+    """Parse a rendered toml content.
+
+    The rendered content is the same for every config read of a relayer \
+        session, it is parsed once. The config returned is cached and \
+        shared, _get_bridge_relayer_config returns a copy of it.
+
+    Args:
+        rendered_content (str): The toml content rendered
+
+    Returns:
+        Dict[str, Any]: The bridge relayer config
+    """
+    return tomli.loads(rendered_content)
+
+
 def _get_bridge_relayer_config()-> Dict[str, Any]:
     """Get the bridge relayer config values.
 
     Returns:
-        Dict[str, Any]: The bridge relayer config
+        Dict[str, Any]: The bridge relayer config, a copy the caller can \
+            modify
     """
     toml_file: str = get_toml_file()
     config_content: str = get_config_content(toml_file=toml_file)
     rendered_content: str = replace_placeholders(config_content)
-    _bridge_relayer_config: Dict[str, Any] = tomli.loads(rendered_content)
+    _bridge_relayer_config: Dict[str, Any] = copy.deepcopy(
+        _parse_config(rendered_content))
     
     return _bridge_relayer_config
 
@@ -153,19 +231,32 @@ def get_blockchain_config(chain_id: int) -> RelayerBlockchainConfigDTO:
     Args:
         chain_id (int): The chain id
 
+    Raises:
+        BridgeRelayerConfigBlockchainDataMissing
+
     Returns:
         RelayerBlockchainDTO: The bridge relayer blockchain config DTO
     """
     _bridge_relayer_config: Dict[str, Any] = _get_bridge_relayer_config()
-    relayer_blockchain: Dict[str, Any] = {}
+    sections: Dict[str, Any] = _bridge_relayer_config['relayer_blockchain']
+    
+    # Direct lookup of the documented key, the scan is only needed for a 
+    # section name written with another casing.
+    section: Any = sections.get(f"ChainId{chain_id}")
+    if section is None:
+        chain_key: str = f"chainid{chain_id}"
+        section = next(
+            (v for k, v in sections.items() if k.lower() == chain_key), None)
+    
+    if section is None:
+        raise BridgeRelayerConfigBlockchainDataMissing(
+            f"No blockchain config for chain id {chain_id}")
     
-    for k, v in _bridge_relayer_config['relayer_blockchain'].items():
-        if k.lower() != f"chainid{chain_id}":
-            continue
-        
-        relayer_blockchain.update(v)
-        relayer_blockchain.update({"chain_id": chain_id})
-        relayer_blockchain.update({"abi": get_abi(chain_id=chain_id)})
+    relayer_blockchain: Dict[str, Any] = {
+        **section, 
+        "chain_id": chain_id, 
+        "abi": get_abi(chain_id=chain_id),
+    }
     
     try:
         return RelayerBlockchainConfigDTO(**relayer_blockchain)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class RelayerBlockchainConfigDTO:
     """Relayer blockchain config DTO."""
     
@@ -21,7 +21,7 @@ class RelayerBlockchainConfigDTO:
         return f"ChainId{self.chain_id}"
     
     
-@dataclass
+@dataclass(slots=True)
 class RelayerRegisterConfigDTO:
     """Relayer register config DTO."""
     host: str
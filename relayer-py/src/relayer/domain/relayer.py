@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 
 from src.relayer.domain.base import BaseResult
 
@@ -15,7 +15,7 @@ class BridgeTaskResult(BaseResult):
     """Result DTO for bridge task."""
     
 
-@dataclass
+@dataclass(slots=True)
 class BridgeTaskTxResult:
     """Result DTO for bridge task Transaction."""
 
@@ -27,7 +27,7 @@ class BridgeTaskTxResult:
 
 #  Relayer blockchain Task
 
-@dataclass
+@dataclass(slots=True)
 class BridgeTaskDTO:
     """DTO for blockchain bridge relayer contract's function."""
     
@@ -37,16 +37,36 @@ class BridgeTaskDTO:
 
 # Relayer blockchain Event
 
-@dataclass
+@dataclass(slots=True)
 class EventDTO:
     """Event DTO from blockchain."""
     
     name: str
     data: Any
 
+    def __setstate__(
+        self,
+        state: Union[Dict[str, Any], Tuple[Optional[dict], Dict[str, Any]]],
+    ) -> None:
+        """Restore the fields of an unpickled event.
+
+        The state is a (None, slots) tuple, or a dict for an event pickled \
+            before the DTO was slotted and still waiting in the queue.
+
+        Args:
+            state (Union[Dict[str, Any], Tuple[Optional[dict], Dict[str, Any]]]): \
+                The pickled state
+        """
+        if isinstance(state, tuple):
+            legacy_state, state = state
+            state = {**(legacy_state or {}), **state}
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
 # Relayer register Event
 
-@dataclass
+@dataclass(slots=True)
 class EventMessageDTO:
     """Event message to register."""
     
@@ -7,18 +7,29 @@ https://web3py.readthedocs.io/
 """
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Dict, List, NoReturn
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Union,
+)
 
-from attributedict.collections import AttributeDict
+from aiohttp import ClientError
+from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from eth_account.datastructures import SignedTransaction
+from eth_keys.datatypes import PrivateKey
 from hexbytes import HexBytes
 from web3 import AsyncWeb3, AsyncHTTPProvider
 from web3.contract.async_contract import AsyncContract
 from web3.middleware.geth_poa import async_geth_poa_middleware
 from web3._utils.filters import AsyncLogFilter
+from web3.exceptions import Web3Exception
 from web3.types import (
-    BlockData,
     TxReceipt,
     Nonce,
 )
@@ -33,11 +44,42 @@ from src.relayer.domain.relayer import (
 )
 from src.relayer.config import get_blockchain_config, get_abi
 
+if TYPE_CHECKING:  # Only used for type hints, not imported at runtime
+    from attributedict.collections import AttributeDict
+    from eth_account.datastructures import SignedTransaction
+
 
 LOG_FORMAT = ('%(levelname) -10s %(asctime)s %(name) -30s %(funcName) '
               '-35s %(lineno) -5d: %(message)s')
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Max poll interval (in second) reached when backing off on RPC errors
+MAX_POLL_INTERVAL = 60
+RPC_ERRORS = (Web3Exception, ClientError, asyncio.TimeoutError)
+
+
+def _is_rpc_error(error: Exception) -> bool:
+    """Check if an error comes from the node or the connection to it.
+
+    web3 raises a JSON-RPC error response (e.g. -32005 limit exceeded, \
+        filter not found) as a ValueError of the error dict, any other \
+        ValueError is a bug and is not retried.
+
+    Args:
+        error (Exception): The error raised
+
+    Returns:
+        bool: True if the error is an RPC error
+    """
+    if isinstance(error, RPC_ERRORS):
+        return True
+    return (
+        isinstance(error, ValueError)
+        and len(error.args) == 1
+        and isinstance(error.args[0], dict)
+        and "code" in error.args[0]
+    )
+
 
 class RelayerBlockchainProvider(IRelayerBlockchain):
     """Relayer blockchain provider."""
@@ -54,6 +96,11 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         self.relay_blockchain_config: Any
         self.w3: AsyncWeb3
         self.w3_contract: AsyncContract
+        self._client_versions: Dict[int, str] = {}
+        # Relayer accounts by chain id, and their parsed private keys by 
+        # address, derived once per provider instance
+        self._accounts: Dict[int, LocalAccount] = {}
+        self._private_keys: Dict[str, PrivateKey] = {}
         
         # Set Logging
         self._set_logging(debug)
@@ -83,9 +130,18 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
     def set_chain_id(self, chain_id: int) -> None:
         """Set the blockchain id.
 
+        The provider is connected once per chain id, setting the chain id \
+            it is already connected to does nothing.
+
         Args:
             chain_id (int): The chain id
         """
+        if (
+            getattr(self, "chain_id", None) == chain_id 
+            and hasattr(self, "w3_contract")
+        ):
+            return
+        
         self.chain_id = chain_id
         self.relay_blockchain_config = get_blockchain_config(self.chain_id)
         self._connect()
@@ -96,8 +152,7 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         Returns:
             (int): The block number
         """
-        block_data: BlockData = await self._get_block_data()
-        return block_data.number # type: ignore
+        return await self.w3.eth.block_number
     
     def listen_events(
         self, 
@@ -138,13 +193,15 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         Returns:
             BridgeTaskResult: The bridge task execution result
         """
-        LOGGER.info(f"Call smart contract's function {bridge_task_dto}!")
-        LOGGER.info(f"Client version : {await self.client_version()}!")
+        LOGGER.info("Call smart contract's function %s!", bridge_task_dto)
         
         result = BridgeTaskResult()
-        pk: str = self.relay_blockchain_config.pk
-        account: LocalAccount = self.w3.eth.account.from_key(pk)
-        nonce: Nonce = await self._get_nonce(account=account)
+        account: LocalAccount = self._get_account()
+        client_version, nonce = await asyncio.gather(
+            self.client_version(),
+            self._get_nonce(account=account),
+        )
+        LOGGER.info(f"Client version : {client_version}!")
         # estimated_gas = await self._estimate_gas(
         #     func_name=bridge_task_dto.func_name)
         # LOGGER.info(f"estimated gas for '{bridge_task_dto.func_name}' {estimated_gas}!")
@@ -160,7 +217,7 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
                 nonce=nonce
             )
 
-            signed_tx: SignedTransaction = self._sign_tx(unsent_built_tx, account=account)
+            signed_tx: 'SignedTransaction' = self._sign_tx(unsent_built_tx, account=account)
             tx_hash: HexBytes = await self._send_raw_tx(signed_tx=signed_tx)
             tx_receipt: TxReceipt = await self._wait_for_transaction_receipt(tx_hash)
 
@@ -172,8 +229,8 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
             )
         except Exception as e:
             LOGGER.error(
-                f"Call smart contract's function {bridge_task_dto} "
-                f"failed with error : {e}"
+                "Call smart contract's function %s failed with error : %s",
+                bridge_task_dto, e
             )
             result.err = e
             
@@ -202,31 +259,32 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
     def _connect(self) -> None:
         """Connect to client provider.
 
+        The cached client version of the chain id is dropped, the node may \
+            have been upgraded or replaced since it was requested.
+
         Returns:
             None
         """
+        self._client_versions.pop(self.chain_id, None)
         self.w3 = self._set_provider()
         self.w3_contract = self._set_contract()
     
     async def client_version(self) -> str:
         """Get the client version
 
+        The client version is requested once per chain id and then cached.
+
         Returns:
             str: the client version
         """
         try:
-            return await self.w3.client_version
+            if self.chain_id not in self._client_versions:
+                self._client_versions[self.chain_id] = \
+                    await self.w3.client_version
+            return self._client_versions[self.chain_id]
         except Exception as e:
             raise BridgeRelayerBlockchainNotConnected(e)
     
-    async def _get_block_data(self) -> BlockData:
-        """Get the block data.
-
-        Returns:
-            (BlockData): The block data
-        """
-        return await self.w3.eth.get_block("latest")       
-            
     def _set_provider(self) -> AsyncWeb3:
         """Set the web3 provider.
 
@@ -281,20 +339,28 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
             for event in self.w3_contract.events # type: ignore
         ]
             
+    async def _gather_event_filters(self) -> List[AsyncLogFilter]:
+        """Await the coroutine event filters concurrently.
+
+        Returns:
+            List[AsyncLogFilter]: A list of event filter log
+        """
+        return await asyncio.gather(*self._create_event_filters())
+
     def _execute_event_filters(self) -> List[AsyncLogFilter]:
         """Execute the coroutine event filters.
 
+        The filters are created concurrently within a single event loop \
+            instead of one event loop (and one round-trip) per filter.
+
         Returns:
             List[AsyncLogFilter]: A list of event filter log
         """
         LOGGER.info('Execute the event filters!')
         
-        return [
-            asyncio.run(event_filter) 
-            for event_filter in self._create_event_filters()
-        ]
+        return asyncio.run(self._gather_event_filters())
     
-    def create_event_dto(self, event: AttributeDict) -> EventDTO:
+    def create_event_dto(self, event: 'AttributeDict') -> EventDTO:
         """Create a Event DTO from the event.
 
         Args:
@@ -307,7 +373,7 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         
         return EventDTO(name=event.event, data=event.args)
     
-    def _handle_event(self, event: AttributeDict, callback: Callable) -> None:
+    def _handle_event(self, event: 'AttributeDict', callback: Callable) -> None:
         """Handle the event. 
         
         The event must be handled by the callback function that is defined\
@@ -317,7 +383,7 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
             event (AttributeDict): The event received from blockchain
             callback (Callable): A callback function
         """
-        LOGGER.info(f'Handle the event : {event}')
+        LOGGER.info('Handle the event : %s', event)
         
         event_dto: EventDTO = self.create_event_dto(event)
         callback(event_dto)
@@ -325,23 +391,25 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
     async def _loop_handle_event(
         self,
         event_filter: AsyncLogFilter,
-        poll_interval: int,
         callback: Callable,
     ):
-        """Handle an event filter.
+        """Handle the new entries of an event filter.
+
+        The new entries are handled as one batch, the poll interval is \
+            awaited by the caller between two polls and not after each event.
 
         Args:
             event_filter (AsyncLogFilter): The web3 event filter
-            poll_interval (int): The loop poll interval in second
             callback (Callable): A callback function to handle event
 
         Returns:
             NoReturn
         """
+        handle_event: Callable = self._handle_event
+        
         for event in await event_filter.get_new_entries():
-            self._handle_event(event, callback) # type: ignore
-
-            await asyncio.sleep(poll_interval)   
+            if event is not None:
+                handle_event(event, callback)
     
     async def _log_loop(
         self, 
@@ -361,17 +429,48 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         """
         LOGGER.info(f"Listen to event {event_filter}!")
         
+        interval: int = poll_interval
+        # The back off never polls faster than the caller's poll interval
+        max_interval: int = max(MAX_POLL_INTERVAL, poll_interval)
         while True:
-            await self._loop_handle_event(
-                event_filter=event_filter,
-                poll_interval=poll_interval,
-                callback=callback,
-            )
-            await asyncio.sleep(poll_interval)
+            try:
+                await self._loop_handle_event(
+                    event_filter=event_filter,
+                    callback=callback,
+                )
+                interval = poll_interval
+            except (*RPC_ERRORS, ValueError) as e:
+                if not _is_rpc_error(e):
+                    raise
+                interval = min(max(interval, 1) * 2, max_interval)
+                LOGGER.warning(
+                    "Get new entries failed with error : %s. "
+                    "Poll interval set to %ss",
+                    e, interval
+                )
+            await asyncio.sleep(interval)
 
     # -------------------------------------------------------------
     # Send Tx to chain
     # -------------------------------------------------------------
+    def _get_account(self) -> LocalAccount:
+        """Get the relayer account.
+
+        Deriving the account costs a secp256k1 scalar multiplication, it is \
+            derived once per chain id on first use, not in set_chain_id as \
+            the event listener needs no private key.
+
+        Returns:
+            LocalAccount: A collection of convenience methods to sign and \
+                encrypt, with an embedded private key.
+        """
+        account: Optional[LocalAccount] = self._accounts.get(self.chain_id)
+        if account is None:
+            account = Account.from_key(self.relay_blockchain_config.pk)
+            self._accounts[self.chain_id] = account
+            self._private_keys[account.address] = PrivateKey(account.key)
+        return account
+    
     async def _get_nonce(self, account: LocalAccount) -> Nonce:
         """Get the nonce.
 
@@ -423,10 +522,11 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
             Dict[str, Any]: The built transaction
         """
         LOGGER.info(
-            f"Build a transaction with "
-            f"func name : {bridge_task_dto.func_name} "
-            f"params    : {bridge_task_dto.params} "
-            f"address: {account.address}!")
+            "Build a transaction with "
+            "func name : %s "
+            "params    : %s "
+            "address: %s!",
+            bridge_task_dto.func_name, bridge_task_dto.params, account.address)
         
         try:
             return await func(**bridge_task_dto.params) \
@@ -437,16 +537,14 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
                     # "maxPriorityFeePerGas": 1000000000
                 })
         except Exception as e:
-            print("******************************************")
-            print(e)
-            print("******************************************")
+            LOGGER.error("Build transaction failed! error=%s", e)
             raise
 
     def _sign_tx(
         self, 
         built_tx: Dict[str, Any], 
         account: LocalAccount
-    ) -> SignedTransaction:
+    ) -> 'SignedTransaction':
         """Sign the transaction.
 
         Args:
@@ -457,17 +555,18 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         Returns:
             SignedTransaction: The signed transaction
         """
-        LOGGER.info(f"Sign the transaction : {built_tx}!")
+        LOGGER.info("Sign the transaction : %s!", built_tx)
         
-        try:
-            return self.w3.eth.account.sign_transaction(
-                built_tx, private_key=account.key)
-        except Exception as e:
-            raise
+        # The key parsed by _get_account, signing with the raw key bytes 
+        # would parse it again on every transaction.
+        private_key: Union[PrivateKey, bytes] = self._private_keys.get(
+            account.address, account.key)
+        return self.w3.eth.account.sign_transaction(
+            built_tx, private_key=private_key)
     
     async def _send_raw_tx(
         self, 
-        signed_tx: SignedTransaction
+        signed_tx: 'SignedTransaction'
     ) -> HexBytes:
         """Send the raw transaction.
 
@@ -477,7 +576,7 @@ class RelayerBlockchainProvider(IRelayerBlockchain):
         Returns:
             HexBytes: The transaction hash
         """
-        LOGGER.info(f"Send the raw transaction signed_tx : {signed_tx}!")
+        LOGGER.info("Send the raw transaction signed_tx : %s!", signed_tx)
         
         return await self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
         
@@ -5,7 +5,7 @@ Events are sent to RabbitMQ, a messaging and streaming broker.
 https://www.rabbitmq.com/
 """
 import logging
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Set, Union
 
 from pika import (
     BasicProperties,
@@ -16,7 +16,7 @@ from pika import (
 )
 from pika.spec import Basic
 from pika.adapters.blocking_connection import BlockingChannel
-from pika.exceptions import AMQPConnectionError
+from pika.exceptions import AMQPConnectionError, AMQPError
 
 from src.relayer.interface.relayer import IRelayerRegister
 from src.relayer.config import get_register_config
@@ -33,12 +33,23 @@ from src.relayer.domain.exception import (
 LOG_FORMAT = ('%(levelname) -10s %(asctime)s %(name) -30s %(funcName) '
               '-35s %(lineno) -5d: %(message)s')
 LOGGER: logging.Logger = logging.getLogger(__name__)
+# Properties of the published messages, the same for every message
+PERSISTENT_PROPERTIES = BasicProperties(delivery_mode=DeliveryMode.Persistent)
 
 
 class RelayerRegisterEvent(IRelayerRegister):
     """Relayer register provider
     
     RabbitMQ is used as messaging and streaming broker. 
+    
+    The publishing connection is kept open between the registered events, \
+        call close() when the provider is not used anymore. The channel is \
+        in confirm mode, an event is registered once RabbitMQ has \
+        acknowledged it. An event published again after a lost connection \
+        can be delivered twice (at least once delivery).
+    
+    An instance is not thread-safe, as the pika BlockingConnection it \
+        reuses. Use one instance per thread.
     """
 
     def __init__(self, debug: bool = False) -> None:
@@ -51,6 +62,10 @@ class RelayerRegisterEvent(IRelayerRegister):
         self.relayer_register_config = get_register_config()
         self.queue_name: str = self.relayer_register_config.queue_name
         self.callback: Callable
+        # Publishing connection, reused across the registered events
+        self._connection: Optional[BlockingConnection] = None
+        self._channel: Optional[BlockingChannel] = None
+        self._declared_queues: Set[str] = set()
         
         # Set Logging
         self._set_logging(debug)
@@ -100,7 +115,7 @@ class RelayerRegisterEvent(IRelayerRegister):
             LOGGER.critical(
                 f"Failed Registering message to RabbitMQ! "
                 f"event: {event}, error: {e}")
-            BridgeRelayerRegisterEventFailed(e)
+            raise BridgeRelayerRegisterEventFailed(e)
     
     def read_events(self, callback: Callable) -> None:
         """Consume event tasks.
@@ -119,7 +134,15 @@ class RelayerRegisterEvent(IRelayerRegister):
         
         except Exception as e:
             LOGGER.critical(f"Failed Reading message from RabbitMQ! {e}")
-            BridgeRelayerReadEventFailed(e)
+            raise BridgeRelayerReadEventFailed(e)
+
+    def close(self) -> None:
+        """Close the publishing connection.
+        
+        The provider can still be used, a new connection is opened by the \
+            next registered event.
+        """
+        self._close_connection()
 
     # ------------------------------------------------------------------
     # Internal functions
@@ -289,25 +312,94 @@ class RelayerRegisterEvent(IRelayerRegister):
         LOGGER.info('Sending message to RabbitMQ ...')
 
         try:
-            connection: BlockingConnection = self._connect()
-            channel: BlockingChannel = self._get_channel(connection=connection)
-            channel: BlockingChannel = self._declare_queue(
-                channel=channel, queue_name=routing_key)
-
-            channel.basic_publish(
-                exchange=exchange,
-                routing_key=routing_key,
-                body=message,
-                properties=BasicProperties(
-                    delivery_mode = DeliveryMode.Persistent
+            try:
+                self._publish(
+                    routing_key=routing_key, 
+                    message=message, 
+                    exchange=exchange,
+                )
+            except AMQPError:
+                # The reused connection may have been closed by the broker 
+                # (e.g. missed heartbeats), retry once with a new one.
+                self._close_connection()
+                self._publish(
+                    routing_key=routing_key, 
+                    message=message, 
+                    exchange=exchange,
                 )
-            )
-            
-            connection.close()
         except Exception as e:
             LOGGER.critical('Error Sending message to RabbitMQ!')
+            self._close_connection()
             raise
 
+    def _publish(
+        self, 
+        routing_key: str,
+        message: Union[str, bytes],
+        exchange: str,
+    ) -> None:
+        """Publish a persistent message on the publishing channel.
+
+        Args:
+            routing_key (str): The routing key name
+            message (Union[str, bytes]): The message
+            exchange (str): The exchange name
+        """
+        channel: BlockingChannel = self._get_publish_channel(
+            routing_key=routing_key)
+        # Raises NackError or UnroutableError if RabbitMQ did not take the 
+        # message, the channel being in confirm mode.
+        channel.basic_publish(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=message,
+            properties=PERSISTENT_PROPERTIES,
+            mandatory=True,
+        )
+
+    def _get_publish_channel(self, routing_key: str) -> BlockingChannel:
+        """Get the channel that publishes the messages.
+        
+        The connection and its channel are opened for the first message and \
+            reused by the next ones, instead of one connection per message. \
+            The channel is put in confirm mode, so that a message lost on a \
+            connection closed by the broker raises instead of being dropped \
+            silently. Each queue is declared once per channel.
+
+        Args:
+            routing_key (str): The routing key name
+
+        Returns:
+            BlockingChannel: The blocking channel instance
+        """
+        if self._connection is None or self._connection.is_closed:
+            self._connection = self._connect()
+            self._channel = None
+            
+        if self._channel is None or self._channel.is_closed:
+            self._channel = self._get_channel(connection=self._connection)
+            self._channel.confirm_delivery()
+            self._declared_queues = set()
+            
+        if routing_key not in self._declared_queues:
+            self._declare_queue(channel=self._channel, queue_name=routing_key)
+            self._declared_queues.add(routing_key)
+            
+        return self._channel
+
+    def _close_connection(self) -> None:
+        """Close the publishing connection, a new one is opened if needed."""
+        connection: Optional[BlockingConnection] = self._connection
+        self._connection = None
+        self._channel = None
+        self._declared_queues = set()
+        
+        if connection is not None and connection.is_open:
+            try:
+                connection.close()
+            except AMQPError as e:
+                LOGGER.info(f"Closing the RabbitMQ connection failed! {e}")
+
     def _callback(
         self, 
         channel: BlockingChannel, 
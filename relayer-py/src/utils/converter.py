@@ -1,26 +1,29 @@
 """Converter tool."""
-from io import BytesIO
 from typing import Any, Dict
 import pickle
+import sys
 
-from web3.datastructures import AttributeDict
 
-def _serialize_data(data: Any) -> BytesIO:
-    """Serialize data to a BytesIO object.
+def _serialize_data(data: Any) -> bytes:
+    """Serialize data to bytes.
 
     Args:
         data (Any): The data to serialize.
 
     Returns:
-        BytesIO: The data serialized
+        bytes: The data serialized
     """
-    if isinstance(data, AttributeDict):
+    # A web3 AttributeDict exists only if web3 is already imported, so web3 
+    # is not imported here just for this check.
+    web3_datastructures = sys.modules.get("web3.datastructures")
+    if (
+        web3_datastructures is not None 
+        and isinstance(data, web3_datastructures.AttributeDict)
+    ):
         data = dict(data)
     
-    pickle_data = pickle.dumps(
-        data, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
-    return BytesIO(pickle_data)
 
 def to_bytes(data: Any) -> bytes:
     """Convert data to a bytes object.
@@ -31,7 +34,7 @@ def to_bytes(data: Any) -> bytes:
     Returns:
         bytes: The data converted
     """
-    return _serialize_data(data).getvalue()
+    return _serialize_data(data)
 
 
 def from_bytes(data: bytes) -> Any:
@@ -43,4 +46,4 @@ def from_bytes(data: bytes) -> Any:
     Returns:
         bytes: The data converted
     """
-    return pickle.load(BytesIO(data))
+    return pickle.loads(data)
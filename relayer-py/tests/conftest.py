@@ -127,8 +127,23 @@ sys.path.append(
 def setup_module(tmp_path_factory):
     """Create .env file before testing."""
     temp_file = tmp_path_factory.mktemp("test") / TEST_ENV_FILE
-    with temp_file.open(mode="w") as f:
-        for key, value in DATA_TEST.TEST_ENV_VALUES.items(): # type: ignore
-            f.write(f"{key}={value}\n")
+    temp_file.write_text("".join(
+        f"{key}={value}\n" 
+        for key, value in DATA_TEST.TEST_ENV_VALUES.items() # type: ignore
+    ))
     
     load_dotenv(dotenv_path=temp_file)
+
+
+@pytest.fixture(scope="session")
+def blockchain_config():
+    """The blockchain config of CHAIN_ID, parsed once per session."""
+    from src.relayer.config import get_blockchain_config
+    return get_blockchain_config(chain_id=CHAIN_ID)
+
+
+@pytest.fixture(scope="session")
+def event_dto():
+    """The EventDTO of EVENT_SAMPLE, shared by all the tests that read it."""
+    from src.relayer.domain.relayer import EventDTO
+    return EventDTO(name=EVENT_SAMPLE.event, data=EVENT_SAMPLE.args)
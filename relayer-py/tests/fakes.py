@@ -0,0 +1,163 @@
+"""Fakes for the web3 and pika objects used by the relayer providers.
+
+The fakes hold plain attributes and callables, cheaper to build and to access
+than MagicMock. Keep MagicMock for the tests that assert on calls.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Dict, List
+
+from hexbytes import HexBytes
+
+
+# Returned by FakeEth.send_raw_transaction
+TX_HASH = HexBytes(b"tx_hash")
+
+
+def returns(value: Any) -> Callable[..., Any]:
+    """Create a function that returns a value.
+
+    Args:
+        value (Any): The value returned
+
+    Returns:
+        Callable[..., Any]: A function
+    """
+    def _returns(*args, **kwargs) -> Any:
+        return value
+    return _returns
+
+
+def async_returns(value: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Create a coroutine function that returns a value.
+
+    Args:
+        value (Any): The value returned
+
+    Returns:
+        Callable[..., Coroutine[Any, Any, Any]]: A coroutine function
+    """
+    async def _async_returns(*args, **kwargs) -> Any:
+        return value
+    return _async_returns
+
+
+def async_raises(
+    exception: Exception
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Create a coroutine function that raises an exception.
+
+    Args:
+        exception (Exception): The exception raised
+
+    Returns:
+        Callable[..., Coroutine[Any, Any, Any]]: A coroutine function
+    """
+    async def _async_raises(*args, **kwargs) -> Any:
+        raise exception
+    return _async_raises
+
+
+def raises(exception: Exception) -> Callable[..., Any]:
+    """Create a function that raises an exception.
+
+    Args:
+        exception (Exception): The exception raised
+
+    Returns:
+        Callable[..., Any]: A function
+    """
+    def _raises(*args, **kwargs) -> Any:
+        raise exception
+    return _raises
+
+
+@dataclass
+class FakeAccount:
+    """Fake `w3.eth.account`."""
+
+    sign_transaction: Callable[..., Any] = \
+        lambda *args, **kwargs: "signed_tx"
+
+
+@dataclass
+class FakeEth:
+    """Fake `w3.eth`."""
+
+    account: FakeAccount = field(default_factory=FakeAccount)
+    get_transaction_count: Callable[..., Coroutine] = async_returns(1)
+    send_raw_transaction: Callable[..., Coroutine] = \
+        async_returns(TX_HASH)
+    wait_for_transaction_receipt: Callable[..., Coroutine] = \
+        async_returns(None)
+    latest_block_number: int = 1
+
+    @property
+    def block_number(self) -> Coroutine:
+        """Awaitable block number, as `AsyncEth.block_number`."""
+        return async_returns(self.latest_block_number)()
+
+
+@dataclass
+class FakeW3:
+    """Fake `AsyncWeb3`."""
+
+    eth: FakeEth = field(default_factory=FakeEth)
+    version: str = "7.7.7"
+
+    @property
+    def client_version(self) -> Coroutine:
+        """Awaitable client version, as `AsyncWeb3.client_version`."""
+        return async_returns(self.version)()
+
+
+@dataclass
+class FakeLogFilter:
+    """Fake `AsyncLogFilter`."""
+
+    get_new_entries: Callable[..., Coroutine] = async_returns([])
+
+
+@dataclass(frozen=True, slots=True)
+class FakeEvent:
+    """Fake event log, with the attributes read by the provider."""
+
+    event: str
+    args: Any
+
+
+@dataclass
+class FakeBlockingChannel:
+    """Fake pika `BlockingChannel`, keeps the published messages in memory."""
+
+    declared_queues: List[str] = field(default_factory=list)
+    published: List[Dict[str, Any]] = field(default_factory=list)
+    is_closed: bool = False
+    delivery_confirmed: bool = False
+
+    def confirm_delivery(self) -> None:
+        self.delivery_confirmed = True
+
+    def queue_declare(self, queue: str, durable: bool = False) -> None:
+        self.declared_queues.append(queue)
+
+    def basic_publish(self, **kwargs) -> None:
+        self.published.append(kwargs)
+
+
+@dataclass
+class FakeBlockingConnection:
+    """Fake pika `BlockingConnection`, with a single channel."""
+
+    fake_channel: FakeBlockingChannel = field(
+        default_factory=FakeBlockingChannel)
+    is_closed: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        return not self.is_closed
+
+    def channel(self) -> FakeBlockingChannel:
+        return self.fake_channel
+
+    def close(self) -> None:
+        self.is_closed = True
@@ -1,15 +1,22 @@
+from types import SimpleNamespace
 from unittest.mock import patch
+import logging
 import pytest
 
 from web3.datastructures import AttributeDict
 
-from src.relayer.domain.relayer import (
-    EventDTO
-)
+from src.relayer.application import relayer_blockchain
 from src.relayer.application.relayer_blockchain import (
+    ConsumeEventTask,
     ManageEventFromBlockchain,
     RegisterEvent,
 )
+from src.relayer.domain.exception import (
+    BridgeRelayerReadEventFailed,
+    BridgeRelayerRegisterEventFailed,
+)
+from src.relayer.domain.relayer import BridgeTaskResult, EventDTO
+from src.utils.converter import from_bytes, to_bytes
 from src.relayer.provider.mock_relayer_blockchain_web3 import (
     MockRelayerBlockchainProvider
 )
@@ -60,14 +67,7 @@ def manage_event_from_blockchain(
         verbose=False
     )
     
-@pytest.fixture
-def event_dto():
-    return EventDTO(
-        name=DATA_TEST.EVENT_SAMPLE.event, # type: ignore
-        data=DATA_TEST.EVENT_SAMPLE.args , # type: ignore
-    )
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def relayer_register_config_dto():
     """A RelayerRegisterEventConfigDTO instance."""
     return RelayerRegisterEventConfigDTO(
@@ -197,4 +197,261 @@ class TestRegisterEvent:
         queue_name = app._create_queue_name_from_event(
             event_dto, chain_id_source, chain_id_target)
         assert queue_name == queue_name_expected
-        
\ No newline at end of file
+
+
+class FakeListenerProvider:
+    """Blockchain provider that sends the events to the listener callback."""
+    
+    def __init__(self, events) -> None:
+        self.events = events
+        
+    def set_chain_id(self, chain_id):
+        pass
+        
+    def listen_events(self, callback, poll_interval):
+        for event in self.events:
+            callback(event)
+
+
+class FakeRegisterProvider:
+    """Register provider that records the events, or fails to register them."""
+    
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.events = []
+        
+    def register_event(self, event):
+        if self.failures:
+            self.failures -= 1
+            raise BridgeRelayerRegisterEventFailed("Connection refused")
+        self.events.append(event)
+        
+    def read_events(self, callback):
+        raise BridgeRelayerReadEventFailed("Connection refused")
+
+
+class TestManageEventFromBlockchainRegister:
+    """Test the listener when the events fail to be registered."""
+    
+    EVENTS = [
+        EventDTO(name=f"FakeEventName{i}", data={"k": i}) for i in range(3)
+    ]
+    
+    def manage_event_from_blockchain(self, register_provider):
+        return ManageEventFromBlockchain(
+            relayer_blockchain_provider=FakeListenerProvider(self.EVENTS),
+            relayer_register_provider=register_provider,
+            chain_id=80002,
+            verbose=False,
+        )
+    
+    def test_listen_events_survives_a_failed_register(self):
+        """
+        Test listen_events that keeps listening when an event fails to be \
+        registered, and registers it again before the next event.
+        """
+        register_provider = FakeRegisterProvider(failures=1)
+        app = self.manage_event_from_blockchain(register_provider)
+        
+        app.listen_events()
+        
+        assert [from_bytes(event) for event in register_provider.events] \
+            == self.EVENTS
+        assert len(app.pending_events) == 0
+        
+    def test_listen_events_keeps_the_events_while_register_fails(self):
+        """Test listen_events that keeps all the events not registered."""
+        register_provider = FakeRegisterProvider(failures=len(self.EVENTS))
+        app = self.manage_event_from_blockchain(register_provider)
+        
+        app.listen_events()
+        
+        assert register_provider.events == []
+        assert [from_bytes(event) for event in app.pending_events] \
+            == self.EVENTS
+
+    def test_listen_events_logs_a_failed_register(self, caplog):
+        """Test listen_events that logs ERROR when an event is not registered."""
+        register_provider = FakeRegisterProvider(failures=1)
+        app = self.manage_event_from_blockchain(register_provider)
+        
+        with caplog.at_level(logging.ERROR):
+            app.listen_events()
+        
+        assert [record.getMessage() for record in caplog.records] == [
+            "Register event failed, 1 event(s) pending: Connection refused"
+        ]
+
+    def test_listen_events_drops_the_oldest_event_when_pending_is_full(
+        self, 
+        caplog,
+        monkeypatch
+    ):
+        """
+        Test listen_events that keeps MAX_PENDING_EVENTS events and logs \
+        ERROR when the oldest is dropped.
+        """
+        monkeypatch.setattr(relayer_blockchain, "MAX_PENDING_EVENTS", 2)
+        register_provider = FakeRegisterProvider(failures=len(self.EVENTS))
+        app = self.manage_event_from_blockchain(register_provider)
+        
+        with caplog.at_level(logging.ERROR):
+            app.listen_events()
+        
+        assert [from_bytes(event) for event in app.pending_events] \
+            == self.EVENTS[1:]
+        assert (
+            f"Pending events full (2), the oldest event is dropped: "
+            f"{self.EVENTS[0]!r}"
+        ) in caplog.messages
+
+
+class FakeBlockchainProvider:
+    """Blockchain provider that records the contract's functions called."""
+    
+    def __init__(self) -> None:
+        self.chain_id = None
+        self.calls = []
+        
+    def set_chain_id(self, chain_id):
+        self.chain_id = chain_id
+        
+    async def get_block_number(self):
+        return 100
+        
+    async def call_contract_func(self, bridge_task_dto):
+        self.calls.append((self.chain_id, bridge_task_dto))
+        return BridgeTaskResult()
+
+
+def event_as_bytes(name: str) -> bytes:
+    """An event received from the register, as bytes."""
+    return to_bytes(EventDTO(
+        name=name, 
+        data=SimpleNamespace(
+            operationHash="0x01",
+            params=SimpleNamespace(chainIdFrom=80002, chainIdTo=411),
+            blockStep=90,
+        )
+    ))
+
+
+class TestConsumeEventTask:
+    """Test ConsumeEventTask."""
+    
+    @pytest.fixture
+    def blockchain_provider(self):
+        return FakeBlockchainProvider()
+    
+    @pytest.fixture
+    def consume_event_task(self, blockchain_provider):
+        app = ConsumeEventTask(
+            relayer_blockchain_provider=blockchain_provider,
+            relayer_consumer_provider=None,
+            verbose=False,
+        )
+        for chain_id in (80002, 411):
+            app.blockchain_configs[chain_id] = SimpleNamespace(
+                wait_block_validation=6)
+        return app
+    
+    @pytest.mark.parametrize("name, func_name, chain_id, params", [
+        (
+            "FeesLockedAndDepositConfirmed", 
+            "completeOperation", 
+            411,
+            ["_operationHash", "params", "blockStep"],
+        ),
+        (
+            "FeesDeposited", 
+            "sendFeesLockConfirmation", 
+            411,
+            ["operationHash", "params", "blockStep"],
+        ),
+        (
+            "FeesDepositConfirmed", 
+            "receiveFeesLockConfirmation", 
+            80002,
+            ["operationHash", "params", "operator"],
+        ),
+        (
+            "OperationFinalized", 
+            "receivedFinalizedOperation", 
+            80002,
+            ["operationHash", "params", "blockStep"],
+        ),
+    ])
+    def test__callback_executes_the_event_task(
+        self,
+        consume_event_task,
+        blockchain_provider,
+        name,
+        func_name,
+        chain_id,
+        params,
+    ):
+        """Test _callback that calls the contract's function of the event."""
+        consume_event_task._callback(event_as_bytes(name))
+        
+        [(called_chain_id, bridge_task_dto)] = blockchain_provider.calls
+        assert called_chain_id == chain_id
+        assert bridge_task_dto.func_name == func_name
+        assert list(bridge_task_dto.params) == params
+        
+    def test__callback_executes_on_the_second_event_of_an_operation(
+        self,
+        consume_event_task,
+        blockchain_provider,
+    ):
+        """
+        Test _callback that confirms the fees locked and the deposit once \
+        both events of the operation are received.
+        """
+        consume_event_task._callback(event_as_bytes("OperationCreated"))
+        assert blockchain_provider.calls == []
+        
+        consume_event_task._callback(event_as_bytes("FeesLockedConfirmed"))
+        [(chain_id, bridge_task_dto)] = blockchain_provider.calls
+        assert chain_id == 80002
+        assert bridge_task_dto.func_name == \
+            "confirmFeesLockedAndDepositConfirmed"
+        assert consume_event_task.confirm_fees_locked_deposit_event == set()
+        
+    @pytest.mark.asyncio
+    async def test__wait_for_block_validation_polls_until_block_validated(
+        self,
+        consume_event_task,
+        blockchain_provider,
+    ):
+        """Test _wait_for_block_validation that polls the latest block."""
+        block_numbers = iter([90, 95, 96])
+        
+        async def get_block_number():
+            return next(block_numbers)
+        
+        blockchain_provider.get_block_number = get_block_number
+        await consume_event_task._wait_for_block_validation(
+            block_validated=96, poll_interval=0)
+        assert next(block_numbers, None) is None
+
+    def test__callback_ignores_unknown_event(
+        self,
+        consume_event_task,
+        blockchain_provider,
+    ):
+        """Test _callback that ignores the events without task."""
+        consume_event_task._callback(event_as_bytes("UnknownEvent"))
+        assert blockchain_provider.calls == []
+        
+    def test_call_stops_on_read_failure(self, blockchain_provider):
+        """
+        Test __call__ that stops the worker when the events cannot be read, \
+        the message not acknowledged is delivered again by RabbitMQ.
+        """
+        app = ConsumeEventTask(
+            relayer_blockchain_provider=blockchain_provider,
+            relayer_consumer_provider=FakeRegisterProvider(),
+            verbose=False,
+        )
+        with pytest.raises(BridgeRelayerReadEventFailed):
+            app()
@@ -1,10 +1,9 @@
-import importlib
 import os
-import sys
 from typing import Dict
 from unittest.mock import patch
 import pytest
 
+import src.relayer.config as relayer_config
 from src.relayer.domain.config import (
     RelayerBlockchainConfigDTO, 
     RelayerRegisterConfigDTO,
@@ -19,22 +18,32 @@ from src.relayer.domain.exception import (
 )
 
 
+# The environment is read when the config functions are called, the module 
+# is imported once and shared by the tests instead of being reloaded.
+# The env files are loaded again by each test.
 @pytest.fixture
-def config():
-    os.environ['DEV_ENV'] = "True"
-    if 'src.relayer.config' in sys.modules:
-        importlib.reload(sys.modules['src.relayer.config'])
-    import src.relayer.config as config
-    return config
+def config(monkeypatch):
+    monkeypatch.setenv('DEV_ENV', "True")
+    monkeypatch.setattr(relayer_config, "ENV_FILES_LOADED", set())
+    return relayer_config
 
 
 @pytest.fixture
-def config_prod():
-    os.environ['DEV_ENV'] = "False"
-    if 'src.relayer.config' in sys.modules:
-        importlib.reload(sys.modules['src.relayer.config'])
-    import src.relayer.config as config
-    return config
+def config_prod(monkeypatch):
+    monkeypatch.setenv('DEV_ENV', "False")
+    monkeypatch.setattr(relayer_config, "ENV_FILES_LOADED", set())
+    return relayer_config
+
+
+@pytest.fixture(scope="module")
+def abi_file(tmp_path_factory):
+    """An abi file written once and read by the get_abi tests."""
+    abi_file = tmp_path_factory.mktemp("abi") / "abi.json"
+    abi_file.write_bytes(
+        b'{"80002": [{"type": "function"}], '
+        b'"bkp_441": [], "441": [{"type": "event"}]}'
+    )
+    return abi_file
 
 
 class TestConfig:
@@ -55,6 +64,46 @@ class TestConfig:
         assert blockchain_config_dto.genesis_block == 123456789
         assert blockchain_config_dto.pk == os.environ[f"PK_{chain_id}"]
         
+    def test_get_blockchain_config_finds_chain_id_with_any_casing(
+        self, 
+        config,
+    ):
+        """Test get_blockchain_config that matches the section name case insensitively."""
+        section = {
+            "rpc_url": "https://fake.rpc_url.org",
+            "project_id": "project_id",
+            "pk": "pk",
+            "wait_block_validation": 6,
+            "smart_contract_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "genesis_block": 123456789,
+            "client": "middleware",
+        }
+        bridge_relayer_config = {"relayer_blockchain": {"chainid80002": section}}
+        with patch(
+            'src.relayer.config._get_bridge_relayer_config', 
+            return_value=bridge_relayer_config
+        ):
+            blockchain_config_dto = config.get_blockchain_config(chain_id=80002)
+        assert blockchain_config_dto.chain_id == 80002
+        assert blockchain_config_dto.rpc_url == section["rpc_url"]
+        assert len(blockchain_config_dto.abi) > 0
+
+    def test_bridge_relayer_config_is_not_shared_between_callers(
+        self, 
+        config,
+    ):
+        """
+        Test _get_bridge_relayer_config that returns a copy of the parsed \
+        config, a caller modifying it does not change the next reads.
+        """
+        bridge_relayer_config = config._get_bridge_relayer_config()
+        bridge_relayer_config["relayer_register"]["host"] = "modified"
+        bridge_relayer_config["relayer_blockchain"].clear()
+        
+        bridge_relayer_config = config._get_bridge_relayer_config()
+        assert bridge_relayer_config["relayer_register"]["host"] == "localhost"
+        assert len(bridge_relayer_config["relayer_blockchain"]) > 0
+
     def test_get_blockchain_config_raise_exception_with_bad_chain_id(
         self, 
         config,
@@ -116,6 +165,21 @@ class TestConfig:
         assert os.environ["PK_80002"] == "673e1858045114d92030ad9d6395d462281e63bcd2b96258a04f7ef8dcd4edad"
         assert os.environ["RELAYER_REGISTER_PASSWORD"] == "guest"
     
+    def test_get_toml_file_loads_the_env_file_once(self, config):
+        """Test get_toml_file that loads the env file of the environment once."""
+        with patch('src.relayer.config.load_dotenv') as mock_load_dotenv:
+            config.get_toml_file()
+            config.get_toml_file()
+        assert mock_load_dotenv.call_count == 2
+        assert config.ENV_FILES_LOADED == {True}
+        
+    def test_load_env_file_reads_the_env_file_each_call(self, config):
+        """Test load_env_file that reads the env file again when called."""
+        with patch('src.relayer.config.load_dotenv') as mock_load_dotenv:
+            config.load_env_file()
+            config.load_env_file()
+        assert mock_load_dotenv.call_count == 4
+    
     def test_get_toml_file_returns_prod_env(
         self, 
         config_prod
@@ -161,16 +225,43 @@ class TestConfig:
         
     def test_get_abi_file_raises_exception_file_missing(
         self, 
-        config
+        config,
+        tmp_path,
     ):
         """
         Test get_abi that raises BridgeRelayerConfigABIFileMissing 
         when abi.json file is missing
         """
-        with patch('src.relayer.config.get_abi_file', return_value="missing_abi_file"):
+        abi_file = tmp_path / "missing_abi_file"
+        with patch('src.relayer.config.get_abi_file', return_value=str(abi_file)):
             with pytest.raises(BridgeRelayerConfigABIFileMissing):
                 config.get_abi(chain_id=80002)             
         
+    def test_get_abi_reads_the_abi_file(self, config, abi_file):
+        """Test get_abi that parses the abi of a chain_id from a real file"""
+        with patch('src.relayer.config.get_abi_file', return_value=str(abi_file)):
+            assert config.get_abi(chain_id=80002) == [{"type": "function"}]
+        
+    def test_get_abi_skips_keys_that_are_not_chain_ids(self, config, abi_file):
+        """Test get_abi that does not index the abi backups by chain id"""
+        with patch('src.relayer.config.get_abi_file', return_value=str(abi_file)):
+            assert config.get_abi(chain_id=441) == [{"type": "event"}]
+            with pytest.raises(BridgeRelayerConfigABIAttributeMissing):
+                config.get_abi(chain_id="bkp_441")
+
+    def test_get_abi_accepts_a_str_chain_id(self, config, abi_file):
+        """Test get_abi that accepts a chain_id read as a str"""
+        with patch('src.relayer.config.get_abi_file', return_value=str(abi_file)):
+            assert config.get_abi(chain_id="441") == [{"type": "event"}]
+
+    def test_get_abi_returns_a_copy_of_the_cached_abi(self, config, abi_file):
+        """Test get_abi that returns an abi the caller can modify"""
+        with patch('src.relayer.config.get_abi_file', return_value=str(abi_file)):
+            abi = config.get_abi(chain_id=80002)
+            abi[0]["type"] = "event"
+            abi.append({})
+            assert config.get_abi(chain_id=80002) == [{"type": "function"}]
+        
     def test_get_abi_returns_valid_abi(self, config):
         """Test get_abi that returns an abi for a specific chain_id"""
         abi = config.get_abi(chain_id=80002)
@@ -4,31 +4,33 @@ import pytest
 from src.relayer.domain.config import RelayerBlockchainConfigDTO, RelayerRegisterConfigDTO
 from tests.conftest import DATA_TEST
 
+
+@pytest.fixture(scope="module")
+def blockchain_config():
+    return RelayerBlockchainConfigDTO(
+        chain_id=DATA_TEST.CHAIN_ID,
+        rpc_url=DATA_TEST.RPC_URL,
+        project_id=DATA_TEST.PROJECT_ID,
+        pk=DATA_TEST.PK,
+        wait_block_validation=DATA_TEST.WAIT_BLOCK_VALIDATION,
+        smart_contract_address=DATA_TEST.SMART_CONTRACT_ADDRESS,
+        genesis_block=DATA_TEST.GENESIS_BLOCK,
+        abi=DATA_TEST.ABI[DATA_TEST.ABI_NAME],
+    )
+
+@pytest.fixture(scope="module")
+def register_config():
+    return RelayerRegisterConfigDTO(
+        host=DATA_TEST.REGISTER_CONFIG.host,
+        port=DATA_TEST.REGISTER_CONFIG.port,
+        user=DATA_TEST.REGISTER_CONFIG.user,
+        password=DATA_TEST.REGISTER_CONFIG.password,
+        queue_name=DATA_TEST.REGISTER_CONFIG.queue_name,
+    )
+
+
 class TestRealyerConfig:
         
-    @pytest.fixture
-    def blockchain_config(self):
-        return RelayerBlockchainConfigDTO(
-            chain_id=DATA_TEST.CHAIN_ID,
-            rpc_url=DATA_TEST.RPC_URL,
-            project_id=DATA_TEST.PROJECT_ID,
-            pk=DATA_TEST.PK,
-            wait_block_validation=DATA_TEST.WAIT_BLOCK_VALIDATION,
-            smart_contract_address=DATA_TEST.SMART_CONTRACT_ADDRESS,
-            genesis_block=DATA_TEST.GENESIS_BLOCK,
-            abi=DATA_TEST.ABI[DATA_TEST.ABI_NAME],
-        )
-        
-    @pytest.fixture
-    def register_config(self):
-        return RelayerRegisterConfigDTO(
-            host=DATA_TEST.REGISTER_CONFIG.host,
-            port=DATA_TEST.REGISTER_CONFIG.port,
-            user=DATA_TEST.REGISTER_CONFIG.user,
-            password=DATA_TEST.REGISTER_CONFIG.password,
-            queue_name=DATA_TEST.REGISTER_CONFIG.queue_name,
-        )
-    
     # -----------------------------------------------------
     # Tests
     # -----------------------------------------------------
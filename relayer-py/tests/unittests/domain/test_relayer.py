@@ -7,6 +7,7 @@ from src.relayer.domain.relayer import (
     EventDTO,
     BridgeTaskDTO,
 )
+from src.utils.converter import from_bytes, to_bytes
 
 from tests.conftest import (
     DATA_TEST,
@@ -94,6 +95,29 @@ class TestRealyer:
         assert event_dto.data == self.EVENT_DATA['data']
         assert asdict(event_dto) == self.EVENT_DATA
 
+    def test_event_dto_has_no_instance_dict(self):
+        """Test EventDTO that stores its fields in slots."""
+        event_dto = EventDTO(**self.EVENT_DATA)
+        assert not hasattr(event_dto, "__dict__")
+        
+    def test_event_dto_round_trips_through_bytes(self):
+        """Test EventDTO that is converted to bytes and back."""
+        event_dto = EventDTO(name="FakeEventName", data={"k": "v"})
+        assert from_bytes(to_bytes(event_dto)) == event_dto
+
+    def test_event_dto_loads_a_legacy_pickle(self):
+        """Test EventDTO that loads an event pickled before it was slotted."""
+        legacy_event = (
+            b'\x80\x05\x95\\\x00\x00\x00\x00\x00\x00\x00\x8c\x1asrc.relayer'
+            b'.domain.relayer\x94\x8c\x08EventDTO\x94\x93\x94)\x81\x94}\x94('
+            b'\x8c\x04name\x94\x8c\rFakeEventName\x94\x8c\x04data\x94}\x94'
+            b'\x8c\x01k\x94\x8c\x01v\x94sub.'
+        )
+        assert from_bytes(legacy_event) == EventDTO(
+            name="FakeEventName", 
+            data={"k": "v"},
+        )
+
     # BridgeTaskDTO
     def test_bridge_task_dto_creation(self):
         """Test creation for BridgeTaskDTO."""
@@ -1,24 +1,45 @@
 import asyncio
+import copy
 import logging
+import re
+from types import SimpleNamespace
 from typing import Coroutine, List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import Mock, patch
 from hexbytes import HexBytes
 import pytest
 
 from attributedict.collections import AttributeDict
 
+from eth_account import Account
+from eth_account.datastructures import SignedTransaction
 from web3 import AsyncWeb3
 from web3.contract.async_contract import AsyncContract
+from web3.exceptions import Web3Exception
 from src.relayer.domain.config import RelayerBlockchainConfigDTO
-from src.relayer.domain.relayer import BridgeTaskDTO, EventDTO
+from src.relayer.domain.relayer import (
+    BridgeTaskDTO,
+    BridgeTaskTxResult,
+    EventDTO,
+)
 from src.relayer.domain.exception import (
     BridgeRelayerBlockchainNotConnected,
 )
 from src.relayer.provider.relayer_blockchain_web3 import (
-    RelayerBlockchainProvider
+    LOGGER,
+    RelayerBlockchainProvider,
 )
 from src.relayer.config import get_blockchain_config
-from tests.conftest import EVENT_SAMPLE
+from tests.conftest import EVENT_SAMPLE, PK
+from tests.fakes import (
+    TX_HASH,
+    FakeEvent,
+    FakeLogFilter,
+    FakeW3,
+    async_raises,
+    async_returns,
+    raises,
+    returns,
+)
 
 
 pytest_plugins = ('pytest_asyncio',)
@@ -29,6 +50,9 @@ async def mock_client_version():
 
 ROOT_PATH = "src.relayer.provider.relayer_blockchain_web3"
 CHAIN_ID = 80002
+ACCOUNT = Account.from_key(PK)
+EVENT = FakeEvent(event=EVENT_SAMPLE.event, args=EVENT_SAMPLE.args) # type: ignore
+EVENT_DTO = EventDTO(name=EVENT.event, data=EVENT.args)
 
 bridge_task_dto = BridgeTaskDTO(
     func_name='receiveBridgeOrder_', 
@@ -47,7 +71,125 @@ bridge_task_dto = BridgeTaskDTO(
     }
 )
 
-TX_RECEIPT = AttributeDict({'blockHash': HexBytes('0x21cf5a29ed75c26a669383c58a686fd8bdda55c2620e82ddca9e7ce490dd0547'), 'blockNumber': 7959797, 'contractAddress': None, 'cumulativeGasUsed': 383282, 'effectiveGasPrice': 1000000015, 'from': '0xE4192BF486AeA10422eE097BC2Cf8c28597B9F11', 'gasUsed': 288414, 'logs': [AttributeDict({'address': '0x0000000000000000000000000000000000001010', 'topics': [HexBytes('0x4dfe1bbbcf077ddc3e01291eea2d5c70c2b422b415d95645b9adcfd678cb1d63'), HexBytes('0x0000000000000000000000000000000000000000000000000000000000001010'), HexBytes('0x000000000000000000000000e4192bf486aea10422ee097bc2cf8c28597b9f11'), HexBytes('0x0000000000000000000000006ab3d36c46ecfb9b9c0bd51cb1c3da5a2c81cea6')], 'data': HexBytes('0x0000000000000000000000000000000000000000000000000001064f9e04ac00000000000000000000000000000000000000000000000000048d9bee3a75b1010000000000000000000000000000000000000000000001ac3ac84ce0f81bc7f8000000000000000000000000000000000000000000000000048c959e9c7105010000000000000000000000000000000000000000000001ac3ac95330962073f8'), 'blockNumber': 7959797, 'transactionHash': HexBytes('0xbe9e2d490f4026f18f2b1740e9b1c5d56268d0659ae7687546b1d256d706f2bf'), 'transactionIndex': 1, 'blockHash': HexBytes('0x21cf5a29ed75c26a669383c58a686fd8bdda55c2620e82ddca9e7ce490dd0547'), 'logIndex': 2, 'removed': False})], 'logsBloom': HexBytes('0x00000000080000000000000000000000000000000000000000000000000000000000000000000000000000000000000000008000000000000000000000000000000000080000000008000000000000800000000000000000000100000000000000000000000000000000000000000000000000000000000080000000000000000000000000000000000000000000000000000000000000000000400000000000200000000000000000000000000000000000000000000000000000000000004000000000000000000001020000000000000000010000000000100000000000000000000000000000000000000000000000000000000000000000000000100000'), 'status': 1, 'to': '0xc8f81a3F84a3E96c1676c7F303e191b3E688E8e5', 'transactionHash': HexBytes('0xbe9e2d490f4026f18f2b1740e9b1c5d56268d0659ae7687546b1d256d706f2bf'), 'transactionIndex': 1, 'type': 2})
+BLOCK_HASH = HexBytes('0x21cf5a29ed75c26a669383c58a686fd8bdda55c2620e82ddca9e7ce490dd0547')
+TX_RECEIPT_HASH = HexBytes('0xbe9e2d490f4026f18f2b1740e9b1c5d56268d0659ae7687546b1d256d706f2bf')
+BLOCK_NUMBER = 7959797
+# The receipt attributes read by call_contract_func
+TX_RECEIPT = SimpleNamespace(
+    transactionHash=TX_RECEIPT_HASH,
+    blockHash=BLOCK_HASH,
+    blockNumber=BLOCK_NUMBER,
+    gasUsed=288414,
+    status=1,
+)
+
+TX_RESULT = BridgeTaskTxResult(
+    tx_hash=TX_RECEIPT_HASH.hex(),
+    block_hash=BLOCK_HASH.hex(),
+    block_number=BLOCK_NUMBER,
+    gas_used=TX_RECEIPT.gasUsed,
+)
+
+BUILT_TX = {
+    "to": "0xE4192BF486AeA10422eE097BC2Cf8c28597B9F11",
+    "value": 100,
+    "gas": 21000,
+    "maxFeePerGas": 2000000000,
+    "maxPriorityFeePerGas": 1000000000,
+    "nonce": 1,
+    "chainId": 80002,
+}
+
+EMPTY_HEXBYTES = HexBytes("")
+SIGNED_TX = SignedTransaction(EMPTY_HEXBYTES, EMPTY_HEXBYTES, 1, 2, 3)
+
+CONTRACT_ERROR = ('0x6997e49b', '0x6997e49b')
+# raised by the fake w3, and expected as is by the tests
+SIGN_TX_ERROR = ValueError("bad tx")
+SEND_TX_ERROR = Web3Exception("rejected")
+BUILD_TX_ERROR_PATTERN = re.compile(
+    re.escape(f"Build transaction failed! error={CONTRACT_ERROR}"))
+
+
+class TransactionBuilder:
+    """Fake smart contract's function call that builds a transaction."""
+    
+    def __init__(self, **data):
+        self.data = data
+
+    async def build_transaction(self, **data):
+        return {}
+
+
+class TransactionBuilderRaise(TransactionBuilder):
+    """Fake smart contract's function call that raises a contract error."""
+
+    async def build_transaction(self, **data):
+        raise Exception(CONTRACT_ERROR)
+
+
+async def returns_after(value, delay=0):
+    """Fake event filter coroutine that returns a value after a delay."""
+    await asyncio.sleep(delay)
+    return value
+
+
+class StopLoop(Exception):
+    """Raised to stop an infinite loop under test."""
+
+
+def connect_provider(
+    provider: RelayerBlockchainProvider,
+    blockchain_config: RelayerBlockchainConfigDTO,
+    w3: AsyncWeb3,
+) -> RelayerBlockchainProvider:
+    """Set the chain id of the provider with a shared config and w3."""
+    with patch(
+        f"{ROOT_PATH}.get_blockchain_config", 
+        returns(blockchain_config)
+    ), patch.object(provider, "_set_provider", returns(w3)):
+        provider.set_chain_id(chain_id=123)
+    return provider
+
+
+def copy_provider(
+    template: RelayerBlockchainProvider,
+) -> RelayerBlockchainProvider:
+    """Copy a module-scoped provider for one test.
+    
+    The copy is shallow, its mutable attributes and the logging set by its 
+    debug value are reset here so that tests do not share them.
+    """
+    provider = copy.copy(template)
+    provider._client_versions = {}
+    provider._accounts = {}
+    provider._private_keys = {}
+    provider._set_logging(provider.debug)
+    return provider
+
+
+@pytest.fixture(scope="module")
+def provider_template():
+    """Create the relayer blockchain provider copied by provider_fake_w3."""
+    return RelayerBlockchainProvider(debug=True)
+
+
+@pytest.fixture(scope="module")
+def w3(blockchain_config):
+    """Create the AsyncWeb3 instance once for the module."""
+    provider = RelayerBlockchainProvider(debug=False)
+    provider.relay_blockchain_config = blockchain_config
+    return provider._set_provider()
+
+
+@pytest.fixture(scope="module")
+def connected_providers(blockchain_config, w3):
+    """Connect a provider without and with debug, once for the module."""
+    return {
+        debug: connect_provider(
+            RelayerBlockchainProvider(debug=debug), blockchain_config, w3)
+        for debug in (False, True)
+    }
 
 
 class TestRelayerBlockchainProvider:
@@ -56,34 +198,42 @@ class TestRelayerBlockchainProvider:
     # F I X T U R E S
     # -----------------------------------------------------------------  
     @pytest.fixture
-    def provider(self):
+    def provider(self, connected_providers):
         """Create a relayer blockchain provider."""        
-        provider = RelayerBlockchainProvider(debug=False,)
-        provider.set_chain_id(chain_id=123)
-        return provider
+        return copy_provider(connected_providers[False])
     
     @pytest.fixture
-    def provider_logging(self):
+    def provider_logging(self, connected_providers):
         """Create a relayer blockchain provider with debug."""        
-        provider = RelayerBlockchainProvider(debug=True)
-        provider.set_chain_id(chain_id=123)
-        return provider
+        return copy_provider(connected_providers[True])
         
     
     @pytest.fixture
-    def func(self):
-        """"""
-        class TransactionBuilder:
-            def __init__(self, **data):
-                self.data = data
-
-            async def build_transaction(self, **data):
-                return {}
+    def provider_fake_w3(self, provider_template):
+        """Create a relayer blockchain provider with debug and a fake w3."""
+        provider = copy_provider(provider_template)
+        provider.chain_id = CHAIN_ID
+        provider.w3 = FakeW3()
+        return provider
+    
 
-        def func(**data):
-            return TransactionBuilder(**data)
+    @pytest.fixture
+    def wired_provider(self, provider_fake_w3):
+        """Create a provider_fake_w3 with the call_contract_func steps wired.
         
-        return func
+        Each test overrides only the step it cares about.
+        """
+        provider = provider_fake_w3
+        provider.client_version = async_returns("7.7.7")
+        provider._get_account = lambda: ACCOUNT
+        provider._get_nonce = async_returns(1)
+        provider._get_function_by_name = \
+            lambda bridge_task_dto: TransactionBuilder
+        provider._build_tx = async_returns(BUILT_TX)
+        provider._sign_tx = lambda built_tx, account: SIGNED_TX
+        provider._send_raw_tx = async_returns(TX_HASH)
+        provider._wait_for_transaction_receipt = async_returns(TX_RECEIPT)
+        return provider
     
     
     # -----------------------------------------------------------------
@@ -97,20 +247,73 @@ class TestRelayerBlockchainProvider:
         provider = RelayerBlockchainProvider(debug=False,)
         assert provider.debug is False
 
-    def test_relayer_blockchain_not_connected(self):
+    def test_set_chain_id_does_not_reconnect_to_the_same_chain_id(
+        self, 
+        provider,
+    ):
+        """Test set_chain_id that keeps the connection of the same chain id."""
+        w3, w3_contract = provider.w3, provider.w3_contract
+        with patch(
+            f"{ROOT_PATH}.get_blockchain_config", raises(StopLoop())
+        ), patch.object(provider, "_connect", raises(StopLoop())):
+            provider.set_chain_id(chain_id=123)
+        assert provider.w3 is w3
+        assert provider.w3_contract is w3_contract
+
+    @pytest.mark.asyncio
+    async def test_relayer_blockchain_not_connected(self):
         """Test that the relayer_blockchain is not connected and raise RelayerBlockchainNotConnected."""
         provider = RelayerBlockchainProvider(debug=False)
         with pytest.raises(BridgeRelayerBlockchainNotConnected):
-            provider.client_version()
+            await provider.client_version()
            
-    def test_client_version_with_blockchain_conneted(
+    @pytest.mark.asyncio
+    async def test_client_version_with_blockchain_conneted(
         self, 
-        provider
+        provider_fake_w3
     ):
-        """Test that the w3 is a mock using EthereumTester."""
-        with patch.object(provider, "w3") as mock_provider:
-            mock_provider.client_version = mock_client_version()
-            assert provider.client_version() == asyncio.run(mock_client_version())
+        """Test client_version that returns the client version of the w3."""
+        assert await provider_fake_w3.client_version() == "7.7.7"
+
+    @pytest.mark.asyncio
+    async def test_client_version_is_requested_once_per_chain_id(self):
+        """Test client_version that caches the client version per chain id."""
+        provider = RelayerBlockchainProvider(debug=False)
+        provider.chain_id = CHAIN_ID
+        # A coroutine can be awaited once only
+        provider.w3 = SimpleNamespace(client_version=mock_client_version())
+        
+        assert await provider.client_version() == "7.7.7"
+        assert await provider.client_version() == "7.7.7"
+        
+        provider.chain_id = 123
+        with pytest.raises(BridgeRelayerBlockchainNotConnected):
+            await provider.client_version()
+
+    @pytest.mark.asyncio
+    async def test_client_version_is_requested_again_after_reconnect(self):
+        """Test _connect that drops the cached client version of the chain id."""
+        provider = RelayerBlockchainProvider(debug=False)
+        provider.chain_id = CHAIN_ID
+        provider._client_versions = {CHAIN_ID: "6.6.6", 123: "5.5.5"}
+        fake_w3 = SimpleNamespace(client_version=mock_client_version())
+        
+        with patch.object(
+            provider, "_set_provider", return_value=fake_w3
+        ), patch.object(provider, "_set_contract"):
+            provider._connect()
+
+        assert provider._client_versions == {123: "5.5.5"}
+        assert await provider.client_version() == "7.7.7"
+
+    @pytest.mark.asyncio
+    async def test_get_block_number_does_not_fetch_block_data(
+        self, 
+        provider_fake_w3
+    ):
+        """Test get_block_number that returns the block number only."""
+        provider_fake_w3.w3.eth.latest_block_number = 7866062
+        assert await provider_fake_w3.get_block_number() == 7866062
 
     def test__set_provider_returns_asyncweb3_instance(
         self, 
@@ -139,10 +342,7 @@ class TestRelayerBlockchainProvider:
         provider
     ):
         """Test create_event_dto that returns a EventDTO instance."""
-        event_dto: EventDTO = provider.create_event_dto(EVENT_SAMPLE)
-        assert isinstance(event_dto, EventDTO)
-        assert event_dto.name == EVENT_SAMPLE.event # type: ignore
-        assert event_dto.data == EVENT_SAMPLE.args # type: ignore
+        assert provider.create_event_dto(EVENT) == EVENT_DTO
         
     def test__handle_event_execute_callback(
         self,
@@ -157,109 +357,279 @@ class TestRelayerBlockchainProvider:
                 The callback is defined and used in tha applciation layer.
         """
         def foo(event: EventDTO):
-            assert event.name == EVENT_SAMPLE.event # type: ignore
+            assert event.name == EVENT.event
             
-        provider._handle_event(EVENT_SAMPLE, foo)
+        provider._handle_event(EVENT, foo)
         
     def test__execute_event_filters_returns_list_event_filter(
         self, 
-        provider
+        monkeypatch
     ):
         """Test _execute_event_filters that returns a list of event filter log."""        
-        async def foo():
-            return 777
-        event_filters = [foo()]
+        provider = RelayerBlockchainProvider(debug=False)
+        event_filters = [returns_after(777)]
                 
-        with patch.object(provider, "_create_event_filters") as mock_create_event_filters:
-            mock_create_event_filters.return_value = event_filters
-            result = provider._execute_event_filters()
-            assert result[0] == 777
+        monkeypatch.setattr(
+            provider, "_create_event_filters", returns(event_filters))
+        result = provider._execute_event_filters()
+        assert result[0] == 777
+
+    def test__execute_event_filters_keeps_event_filters_order(
+        self, 
+        monkeypatch
+    ):
+        """Test _execute_event_filters that keeps the order of the filters."""
+        provider = RelayerBlockchainProvider(debug=False)
+        event_filters = [
+            returns_after(1, delay=0.02), 
+            returns_after(2), 
+            returns_after(3, delay=0.01),
+        ]
+
+        monkeypatch.setattr(
+            provider, "_create_event_filters", lambda: event_filters)
+        assert provider._execute_event_filters() == [1, 2, 3]
         
     @pytest.mark.asyncio
-    async def test__handle_event_execute_callback_func(
+    @pytest.mark.parametrize("entries, expected", [
+        ([EVENT], [EVENT_DTO]),
+        ([], []),
+        ([None], []),
+        ([None, EVENT, None], [EVENT_DTO]),
+        ([EVENT, EVENT], [EVENT_DTO, EVENT_DTO]),
+    ])
+    async def test__loop_handle_event_execute_callback_func(
         self,
-        provider
-    ):       
-        """Test _log_loop that execute the callbak function."""       
-        def callback(event_dto):
-            assert isinstance(event_dto, EventDTO)
-
-        mock_event_filter = AsyncMock()
-        attrs = {'get_new_entries.return_value': [EVENT_SAMPLE]}
-        mock_event_filter.configure_mock(**attrs)
+        entries,
+        expected,
+    ):
+        """
+        Test _loop_handle_event that executes the callback function with an \
+        EventDTO for each new entry, and skips the empty entries.
+        """
+        provider = RelayerBlockchainProvider(debug=False)
+        event_dtos = []
+
         await provider._loop_handle_event(
-            event_filter=mock_event_filter,
-            poll_interval=0,
-            callback=callback,   
+            event_filter=FakeLogFilter(get_new_entries=async_returns(entries)),
+            callback=event_dtos.append,   
         )
+        assert event_dtos == expected
 
-    # ---------------------------------------------------------------
-    # L O G G I N G
-    # ---------------------------------------------------------------
-    def test_logging_for__set_provider(
-        self, 
-        caplog,
-        provider_logging
+    @pytest.mark.asyncio
+    async def test__loop_handle_event_does_not_sleep_between_events(
+        self,
+        monkeypatch,
     ):
-        """Test _set_provider that log INFO."""
-        caplog.set_level(logging.INFO)     
-        provider_logging._set_provider()
-        
-        for record in caplog.records:
-            assert record.levelname == "INFO"
-        assert "Setting the w3 provider instance!" in caplog.text
+        """Test _loop_handle_event that handles all the new entries at once."""
+        provider = RelayerBlockchainProvider(debug=False)
+        event_dtos = []
         
-    def test_logging_for__set_contract(
+        monkeypatch.setattr(
+            f"{ROOT_PATH}.asyncio.sleep", async_raises(StopLoop()))
+        await provider._loop_handle_event(
+            event_filter=FakeLogFilter(
+                get_new_entries=async_returns([EVENT, EVENT])),
+            callback=event_dtos.append,   
+        )
+        assert event_dtos == [EVENT_DTO, EVENT_DTO]
+
+    @pytest.mark.asyncio
+    async def test__log_loop_backs_off_on_rpc_error(self, monkeypatch):
+        """Test _log_loop that doubles the poll interval on RPC errors."""
+        provider = RelayerBlockchainProvider(debug=False)
+        errors = iter([
+            Web3Exception("timeout"), 
+            Web3Exception("timeout"), 
+            None, 
+            StopLoop(),
+        ])
+        intervals = []
+
+        async def loop_handle_event(**kwargs):
+            error = next(errors)
+            if error is not None:
+                raise error
+
+        async def sleep(interval):
+            intervals.append(interval)
+
+        monkeypatch.setattr(provider, "_loop_handle_event", loop_handle_event)
+        monkeypatch.setattr(f"{ROOT_PATH}.asyncio.sleep", sleep)
+        with pytest.raises(StopLoop):
+            await provider._log_loop(
+                event_filter=FakeLogFilter(),
+                poll_interval=1,
+                callback=lambda event: None,
+            )
+        assert intervals == [2, 4, 1]
+
+    @pytest.mark.asyncio
+    async def test__log_loop_backs_off_on_json_rpc_error_response(
         self, 
+        monkeypatch,
+    ):
+        """
+        Test _log_loop that backs off on a JSON-RPC error response, raised \
+        by web3 as a ValueError of the error dict.
+        """
+        provider = RelayerBlockchainProvider(debug=False)
+        errors = iter([
+            ValueError({"code": -32005, "message": "limit exceeded"}),
+            ValueError({"code": -32000, "message": "filter not found"}),
+            StopLoop(),
+        ])
+        intervals = []
+
+        async def loop_handle_event(**kwargs):
+            raise next(errors)
+
+        async def sleep(interval):
+            intervals.append(interval)
+
+        monkeypatch.setattr(provider, "_loop_handle_event", loop_handle_event)
+        monkeypatch.setattr(f"{ROOT_PATH}.asyncio.sleep", sleep)
+        with pytest.raises(StopLoop):
+            await provider._log_loop(
+                event_filter=FakeLogFilter(),
+                poll_interval=1,
+                callback=lambda event: None,
+            )
+        assert intervals == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test__log_loop_raises_value_error_not_from_the_node(
+        self, 
+        monkeypatch,
+    ):
+        """Test _log_loop that does not retry a ValueError of a bug."""
+        provider = RelayerBlockchainProvider(debug=False)
+        error = ValueError("bad value")
+
+        monkeypatch.setattr(
+            provider, "_loop_handle_event", async_raises(error))
+        monkeypatch.setattr(
+            f"{ROOT_PATH}.asyncio.sleep", async_raises(StopLoop()))
+        with pytest.raises(ValueError) as e:
+            await provider._log_loop(
+                event_filter=FakeLogFilter(),
+                poll_interval=1,
+                callback=lambda event: None,
+            )
+        assert e.value is error
+
+    @pytest.mark.asyncio
+    async def test__log_loop_does_not_poll_faster_on_rpc_error(
+        self, 
+        monkeypatch,
+    ):
+        """
+        Test _log_loop that keeps a poll interval above the max back off \
+        interval on RPC errors.
+        """
+        provider = RelayerBlockchainProvider(debug=False)
+        errors = iter([
+            Web3Exception("timeout"), 
+            Web3Exception("timeout"), 
+            StopLoop(),
+        ])
+        intervals = []
+
+        async def loop_handle_event(**kwargs):
+            raise next(errors)
+
+        async def sleep(interval):
+            intervals.append(interval)
+
+        monkeypatch.setattr(provider, "_loop_handle_event", loop_handle_event)
+        monkeypatch.setattr(f"{ROOT_PATH}.asyncio.sleep", sleep)
+        with pytest.raises(StopLoop):
+            await provider._log_loop(
+                event_filter=FakeLogFilter(),
+                poll_interval=90,
+                callback=lambda event: None,
+            )
+        assert intervals == [90, 90]
+
+    @pytest.mark.asyncio
+    async def test__log_loop_logs_rpc_error_as_warning(
+        self, 
+        monkeypatch,
         caplog,
-        provider_logging
     ):
-        """Test _set_contract that log INFO."""
-        caplog.set_level(logging.INFO)        
-        provider_logging._set_contract()
-        
-        for record in caplog.records:
-            assert record.levelname == "INFO"
-        assert "Setting the w3 contract instance!" in caplog.text
+        """Test _log_loop that logs the RPC errors as warnings."""
+        provider = RelayerBlockchainProvider(debug=False)
+        # debug=False stops the propagation to the caplog handler
+        monkeypatch.setattr(LOGGER, "propagate", True)
+        errors = iter([Web3Exception("timeout"), StopLoop()])
 
-    def test_logging_for__create_event_filters(
+        async def loop_handle_event(**kwargs):
+            raise next(errors)
+
+        async def sleep(interval):
+            pass
+
+        monkeypatch.setattr(provider, "_loop_handle_event", loop_handle_event)
+        monkeypatch.setattr(f"{ROOT_PATH}.asyncio.sleep", sleep)
+        with caplog.at_level(logging.WARNING, logger=ROOT_PATH):
+            with pytest.raises(StopLoop):
+                await provider._log_loop(
+                    event_filter=FakeLogFilter(),
+                    poll_interval=1,
+                    callback=lambda event: None,
+                )
+        # A set, pytest also attaches its handler to a logger that did not 
+        # propagate when the test started.
+        warnings = {
+            record.getMessage() for record in caplog.records 
+            if record.levelno >= logging.WARNING
+        }
+        assert warnings == {
+            "Get new entries failed with error : timeout. "
+            "Poll interval set to 2s"
+        }
+
+    # ---------------------------------------------------------------
+    # L O G G I N G
+    # ---------------------------------------------------------------
+    @pytest.mark.parametrize("func_name, args, message", [
+        ("_set_provider", (), "Setting the w3 provider instance!"),
+        ("_set_contract", (), "Setting the w3 contract instance!"),
+        ("_create_event_filters", (), "Create the event filters list!"),
+        ("create_event_dto", (EVENT,), "Create event DTO from the event!"),
+    ])
+    def test_logging_for_provider_functions(
         self, 
         caplog,
-        provider_logging
+        provider_logging,
+        func_name,
+        args,
+        message,
     ):
-        """Test _create_event_filters that log INFO."""
-        caplog.set_level(logging.INFO)        
-        provider_logging._create_event_filters()
+        """Test the provider functions that log INFO."""
+        caplog.set_level(logging.INFO)
+        getattr(provider_logging, func_name)(*args)
+        
         for record in caplog.records:
             assert record.levelname == "INFO"
-        assert "Create the event filters list!" in caplog.text
+        assert message in caplog.text
         
     def test_logging_for__execute_event_filters(
         self, 
         caplog,
-        provider_logging
+        monkeypatch,
+        provider_fake_w3
     ):
         """Test _execute_event_filters that log INFO."""
         caplog.set_level(logging.INFO)
-        with patch.object(provider_logging, "_create_event_filters"):
-            provider_logging._execute_event_filters()
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Execute the event filters!" in caplog.text
-    
-    
-    def test_logging_for_create_event_dto(
-        self, 
-        caplog,
-        provider_logging
-    ):
-        """Test create_event_dto that log INFO."""
-        caplog.set_level(logging.INFO)
-        provider_logging.create_event_dto(EVENT_SAMPLE)
+        monkeypatch.setattr(
+            provider_fake_w3, "_create_event_filters", returns([]))
+        provider_fake_w3._execute_event_filters()
         for record in caplog.records:
             assert record.levelname == "INFO"
-        assert "Create event DTO from the event!" in caplog.text
-        
+        assert "Execute the event filters!" in caplog.text
+    
+    
     def test_logging_for__handle_event(
         self, 
         caplog,
@@ -270,170 +640,271 @@ class TestRelayerBlockchainProvider:
             pass
     
         caplog.set_level(logging.INFO)
-        provider_logging._handle_event(EVENT_SAMPLE, callback)
+        provider_logging._handle_event(EVENT, callback)
         for record in caplog.records:
             assert record.levelname == "INFO"
-        assert "Handle the event!" in caplog.text
+        assert "Handle the event : " in caplog.text
             
     def test_logging_for_listen_events(
         self, 
         caplog,
-        provider_logging
+        monkeypatch,
+        provider_fake_w3
     ):
         """Test listen_events that log INFO."""
         def callback(event):
             pass
     
         caplog.set_level(logging.INFO)
-        with patch.object(provider_logging, "_execute_event_filters", return_value=[]):
-            provider_logging.listen_events(callback)
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Listens events (main)" in caplog.text
+        monkeypatch.setattr(
+            provider_fake_w3, "_execute_event_filters", returns([]))
+        provider_fake_w3.listen_events(callback)
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Listens events (main)" in caplog.text
     
     
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._get_nonce")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._get_function_by_name")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._build_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._sign_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._send_raw_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._wait_for_transaction_receipt", return_value=TX_RECEIPT)
     @pytest.mark.asyncio
     async def test_logging_for_call_contract_func(
         self, 
-        m1, m2, m3, m4, m5, m6,
         caplog,
-        provider_logging,
+        wired_provider,
     ):
         """Test call_contract_func that log INFO."""
         caplog.set_level(logging.INFO)
-        await provider_logging.call_contract_func(bridge_task_dto)
+        wired_provider._wait_for_transaction_receipt = \
+            async_returns(TX_RECEIPT)
+        
+        result = await wired_provider.call_contract_func(bridge_task_dto)
+        assert result.ok == TX_RESULT
+        assert result.err is None
         for record in caplog.records:
             assert record.levelname == "INFO"
         assert "Call smart contract's function " in caplog.text
         
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._get_nonce")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._get_function_by_name")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._build_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._sign_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._send_raw_tx")
-    @patch(f"{ROOT_PATH}.RelayerBlockchainProvider._wait_for_transaction_receipt")
     @pytest.mark.asyncio
-    async def test_logging_for_call_contract_func_error_with_exception(
+    async def test_logging_for_call_contract_func_raise_exception(
         self, 
-        m1, m2, m3, m4, m5, m6,
         caplog,
-        provider_logging,
+        wired_provider,
     ):
         """Test call_contract_func that log ERROR on Exception."""
         caplog.set_level(logging.ERROR)
-        m1.side_effect = Exception("fake error")
+        error = Exception("fake error")
+        wired_provider._wait_for_transaction_receipt = async_raises(error)
         
-        await provider_logging.call_contract_func(bridge_task_dto)
+        result = await wired_provider.call_contract_func(bridge_task_dto)
+        assert result.ok is None
+        assert result.err is error
         for record in caplog.records:
             assert record.levelname == "ERROR"
         assert "failed with error : fake error" in caplog.text
         
         
+    @pytest.mark.asyncio
+    async def test_call_contract_func_requests_client_version_and_nonce_concurrently(
+        self,
+        wired_provider,
+    ):
+        """Test call_contract_func that overlaps client version and nonce requests."""
+        client_version_requested = asyncio.Event()
+        nonce_requested = asyncio.Event()
+        built_with_nonces = []
+        
+        async def client_version():
+            client_version_requested.set()
+            await asyncio.wait_for(nonce_requested.wait(), timeout=1)
+            return "7.7.7"
+        
+        async def get_nonce(account):
+            nonce_requested.set()
+            await asyncio.wait_for(client_version_requested.wait(), timeout=1)
+            return 1
+        
+        async def build_tx(func, bridge_task_dto, account, nonce):
+            built_with_nonces.append(nonce)
+            return BUILT_TX
+        
+        wired_provider.client_version = client_version
+        wired_provider._get_nonce = get_nonce
+        wired_provider._build_tx = build_tx
+        result = await wired_provider.call_contract_func(bridge_task_dto)
+            
+        assert result.ok == TX_RESULT
+        assert result.err is None
+        assert built_with_nonces == [1]
+
     @pytest.mark.asyncio
     async def test__get_nonce(
         self,
         caplog,
-        provider_logging
+        provider_fake_w3
     ):
         """Test _get_nonce that returns a Nonce."""
         caplog.set_level(logging.INFO)
-        with patch.object(provider_logging.w3.eth, "get_transaction_count"):
-            pk = provider_logging.relay_blockchain_config.pk
-            account = provider_logging.w3.eth.account.from_key(pk)
-            
-            await provider_logging._get_nonce(account)
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Get nonce for address :" in caplog.text
+        assert await provider_fake_w3._get_nonce(ACCOUNT) == 1
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Get nonce for address :" in caplog.text
         
         
     def test__get_function_by_name(
         self,
         caplog,
-        provider_logging
+        provider_fake_w3
     ):
         """Test _get_function_by_name that returns a Callable."""
         caplog.set_level(logging.INFO)
-        with patch.object(provider_logging.w3_contract, "get_function_by_name"):
-            provider_logging._get_function_by_name(bridge_task_dto)
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Get smart contract's function " in caplog.text
+        w3_contract = Mock(spec_set=["get_function_by_name"])
+        w3_contract.get_function_by_name.return_value = TransactionBuilder
+        provider_fake_w3.w3_contract = w3_contract
+        
+        func = provider_fake_w3._get_function_by_name(bridge_task_dto)
+        assert func is TransactionBuilder
+        w3_contract.get_function_by_name.assert_called_once_with(
+            bridge_task_dto.func_name)
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Get smart contract's function " in caplog.text
+        
+    def test__get_account_derives_account_once(self):
+        """Test _get_account that derives the account from the pk once."""
+        provider = RelayerBlockchainProvider(debug=False)
+        provider.chain_id = CHAIN_ID
+        provider.relay_blockchain_config = AttributeDict({"pk": PK})
+        
+        with patch(
+            f"{ROOT_PATH}.Account.from_key", 
+            wraps=Account.from_key
+        ) as mock_from_key:
+            account = provider._get_account()
+            assert provider._get_account() is account
+            assert mock_from_key.call_count == 1
+        assert account.key == ACCOUNT.key
+        
+    def test__get_account_is_not_shared_between_providers(self):
+        """Test _get_account that keeps the account in the provider instance."""
+        providers = [RelayerBlockchainProvider(debug=False) for _ in range(2)]
+        for provider in providers:
+            provider.chain_id = CHAIN_ID
+            provider.relay_blockchain_config = AttributeDict({"pk": PK})
+        
+        accounts = [provider._get_account() for provider in providers]
+        assert accounts[0] is not accounts[1]
+        assert accounts[0].key == accounts[1].key == ACCOUNT.key
         
     @pytest.mark.asyncio
     async def test__build_tx(
         self,
         caplog,
-        provider_logging,
-        func
+        provider_fake_w3,
     ):
         """Test _build_tx that returns a Dict."""
         caplog.set_level(logging.INFO)
-                       
-        pk = provider_logging.relay_blockchain_config.pk
-        account = provider_logging.w3.eth.account.from_key(pk)
-                
-        await provider_logging._build_tx(
-            func=func,
+        built_tx = await provider_fake_w3._build_tx(
+            func=TransactionBuilder,
             bridge_task_dto=bridge_task_dto,
-            account=account,
+            account=ACCOUNT,
             nonce=1
         )
+        assert built_tx == {}
         for record in caplog.records:
             assert record.levelname == "INFO"
         assert "Build a transaction with " in caplog.text
         
+    @pytest.mark.asyncio
+    async def test__build_tx_raise_exception(
+        self,
+        caplog,
+        provider_fake_w3,
+    ):
+        """Test _build_tx that logs ERROR and raises the contract error."""
+        caplog.set_level(logging.ERROR)
+        with pytest.raises(Exception) as e:
+            await provider_fake_w3._build_tx(
+                func=TransactionBuilderRaise,
+                bridge_task_dto=bridge_task_dto,
+                account=ACCOUNT,
+                nonce=1
+            )
+        assert e.value.args == (CONTRACT_ERROR,)
+        assert BUILD_TX_ERROR_PATTERN.search(caplog.text)
+        
     def test__sign_tx(
         self,
         caplog,
-        provider_logging
+        provider_fake_w3
     ):
         """Test _sign_tx that returns a SignedTransaction."""
         caplog.set_level(logging.INFO)
-        pk = provider_logging.relay_blockchain_config.pk
-        account = provider_logging.w3.eth.account.from_key(pk)
         built_tx = {}
-        with patch.object(provider_logging.w3.eth.account, 'sign_transaction'):
-            provider_logging._sign_tx(built_tx, account)
-            
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Sign the transaction : " in caplog.text
+        
+        assert provider_fake_w3._sign_tx(built_tx, ACCOUNT) == "signed_tx"
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Sign the transaction : " in caplog.text
+    
+    def test__sign_tx_raise_exception(self, provider_fake_w3):
+        """Test _sign_tx that raises the signing exception."""
+        provider_fake_w3.w3.eth.account.sign_transaction = \
+            raises(SIGN_TX_ERROR)
+        
+        with pytest.raises(ValueError) as e:
+            provider_fake_w3._sign_tx({}, ACCOUNT)
+        assert e.value is SIGN_TX_ERROR
+    
+    def test__sign_tx_matches_eth_account_signature(self):
+        """
+        Test _sign_tx that signs as eth_account does with the raw key, with \
+        the private key parsed by _get_account.
+        """
+        provider = RelayerBlockchainProvider(debug=False)
+        provider.chain_id = CHAIN_ID
+        provider.relay_blockchain_config = AttributeDict({"pk": PK})
+        provider.w3 = AsyncWeb3()
+        signed_tx = provider._sign_tx(BUILT_TX, provider._get_account())
+        expected = Account.sign_transaction(BUILT_TX, private_key=PK)
+        assert signed_tx.rawTransaction == expected.rawTransaction
+        assert signed_tx.hash == expected.hash
     
     @pytest.mark.asyncio
     async def test__send_raw_tx(
         self,
         caplog,
-        provider_logging
+        provider_fake_w3
     ):
         """Test _send_raw_tx that returns a HexBytes."""
         caplog.set_level(logging.INFO)
-        from eth_account.datastructures import SignedTransaction
-        signed_tx = SignedTransaction(HexBytes(""), HexBytes(""), 1, 2, 3)
-        with patch.object(provider_logging.w3.eth, 'send_raw_transaction'):
-            await provider_logging._send_raw_tx(signed_tx)
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Send the raw transaction signed_tx : " in caplog.text
+        assert await provider_fake_w3._send_raw_tx(SIGNED_TX) is TX_HASH
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Send the raw transaction signed_tx : " in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test__send_raw_tx_raise_exception(self, provider_fake_w3):
+        """Test _send_raw_tx that raises the client exception."""
+        provider_fake_w3.w3.eth.send_raw_transaction = \
+            async_raises(SEND_TX_ERROR)
+        
+        with pytest.raises(Web3Exception) as e:
+            await provider_fake_w3._send_raw_tx(SIGNED_TX)
+        assert e.value is SEND_TX_ERROR
     
     
     @pytest.mark.asyncio
     async def test__wait_for_transaction_receipt(
         self,
         caplog,
-        provider_logging
+        provider_fake_w3
     ):
         """Test _wait_for_transaction_receipt that returns a TxReceipt."""
         caplog.set_level(logging.INFO)
-        with patch.object(provider_logging.w3.eth, 'wait_for_transaction_receipt'):
-            await provider_logging._wait_for_transaction_receipt(HexBytes(""))
-            for record in caplog.records:
-                assert record.levelname == "INFO"
-            assert "Wait for the transaction receipt for tx_hash : " in caplog.text
+        provider_fake_w3.w3.eth.wait_for_transaction_receipt = \
+            async_returns(TX_RECEIPT)
+        tx_receipt = await provider_fake_w3._wait_for_transaction_receipt(
+            TX_RECEIPT_HASH)
+        assert tx_receipt is TX_RECEIPT
+        for record in caplog.records:
+            assert record.levelname == "INFO"
+        assert "Wait for the transaction receipt for tx_hash : " in caplog.text
     
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""Tests of the RabbitMQ relayer register provider, without a broker."""
+from typing import List
+
+import pytest
+from pika.exceptions import NackError, StreamLostError
+
+from src.relayer.domain.exception import BridgeRelayerRegisterEventFailed
+from src.relayer.provider.relayer_register_pika import (
+    PERSISTENT_PROPERTIES,
+    RelayerRegisterEvent,
+)
+from tests.fakes import FakeBlockingConnection
+
+
+EVENT = b"event"
+
+
+class TestRelayerRegisterEvent:
+
+    # -----------------------------------------------------------------
+    # F I X T U R E S
+    # -----------------------------------------------------------------
+    @pytest.fixture
+    def connections(self) -> List[FakeBlockingConnection]:
+        """The fake connections opened by the provider."""
+        return []
+
+    @pytest.fixture
+    def provider(self, connections):
+        """Create a register provider that connects to fake connections."""
+        provider = RelayerRegisterEvent(debug=False)
+        
+        def connect() -> FakeBlockingConnection:
+            connections.append(FakeBlockingConnection())
+            return connections[-1]
+        
+        provider._connect = connect
+        return provider
+
+    # -----------------------------------------------------------------
+    # T E S T S
+    # -----------------------------------------------------------------
+    def test_register_event_reuses_the_connection(
+        self, 
+        provider, 
+        connections,
+    ):
+        """
+        Test register_event that opens one connection and declares the \
+        queue once for several events.
+        """
+        provider.register_event(event=EVENT)
+        provider.register_event(event=EVENT)
+        
+        assert len(connections) == 1
+        channel = connections[0].fake_channel
+        assert channel.declared_queues == [provider.queue_name]
+        assert channel.published == 2 * [{
+            "exchange": "",
+            "routing_key": provider.queue_name,
+            "body": EVENT,
+            "properties": PERSISTENT_PROPERTIES,
+            "mandatory": True,
+        }]
+
+    def test_register_event_publishes_in_confirm_mode(
+        self, 
+        provider, 
+        connections,
+    ):
+        """Test register_event that publishes on a channel in confirm mode."""
+        provider.register_event(event=EVENT)
+        
+        assert connections[0].fake_channel.delivery_confirmed is True
+
+    def test_register_event_retries_once_on_a_nack(
+        self, 
+        provider, 
+        connections,
+    ):
+        """Test register_event that publishes again a message not confirmed."""
+        provider.register_event(event=EVENT)
+        
+        def basic_publish(**kwargs):
+            raise NackError([])
+        
+        connections[0].fake_channel.basic_publish = basic_publish
+        provider.register_event(event=EVENT)
+        
+        assert len(connections) == 2
+        assert len(connections[1].fake_channel.published) == 1
+
+    def test_close_closes_the_connection(
+        self, 
+        provider, 
+        connections,
+    ):
+        """
+        Test close that closes the publishing connection, the next event \
+        opens a new one.
+        """
+        provider.register_event(event=EVENT)
+        provider.close()
+        
+        assert connections[0].is_closed is True
+        
+        provider.register_event(event=EVENT)
+        assert len(connections) == 2
+
+    def test_register_event_reconnects_after_connection_closed(
+        self, 
+        provider, 
+        connections,
+    ):
+        """Test register_event that opens a new connection if it was closed."""
+        provider.register_event(event=EVENT)
+        connections[0].close()
+        provider.register_event(event=EVENT)
+        
+        assert len(connections) == 2
+        assert len(connections[1].fake_channel.published) == 1
+
+    def test_register_event_retries_once_on_a_stale_connection(
+        self, 
+        provider, 
+        connections,
+    ):
+        """
+        Test register_event that publishes again on a new connection when \
+        the reused one was lost.
+        """
+        provider.register_event(event=EVENT)
+        
+        def basic_publish(**kwargs):
+            raise StreamLostError("connection lost")
+        
+        connections[0].fake_channel.basic_publish = basic_publish
+        provider.register_event(event=EVENT)
+        
+        assert len(connections) == 2
+        assert connections[0].is_closed is True
+        assert len(connections[1].fake_channel.published) == 1
+
+    def test_register_event_raises_exception_when_publish_fails(
+        self, 
+        provider, 
+        connections,
+    ):
+        """
+        Test register_event that raises BridgeRelayerRegisterEventFailed \
+        when the event cannot be published, even on a new connection.
+        """
+        def connect():
+            connection = FakeBlockingConnection()
+            connection.fake_channel.basic_publish = basic_publish
+            connections.append(connection)
+            return connection
+        
+        def basic_publish(**kwargs):
+            raise StreamLostError("connection lost")
+        
+        provider._connect = connect
+        with pytest.raises(BridgeRelayerRegisterEventFailed):
+            provider.register_event(event=EVENT)
+        assert len(connections) == 2
@@ -1,5 +1,4 @@
 import pytest
-from io import BytesIO
 
 from src.utils.converter import (
     to_bytes, 
@@ -32,7 +31,7 @@ class TestConverter:
     @pytest.mark.parametrize("data", PARAM_TESTS)
     def test__serialize_attributedict(self, data):
         """"""
-        assert isinstance(_serialize_data(data), BytesIO)
+        assert isinstance(_serialize_data(data), bytes)
     
     
     @pytest.mark.parametrize("data", PARAM_TESTS)    
@@ -42,3 +41,11 @@ class TestConverter:
         params_deserialized = from_bytes(params_bytes)
         assert isinstance(params_bytes, bytes)
         assert params_deserialized == data
+
+    def test_to_bytes_convert_web3_attributedict_to_dict(self):
+        """Test to_bytes that converts a web3 AttributeDict to a dict."""
+        from web3.datastructures import AttributeDict
+        data = AttributeDict({"k": "v"})
+        params_deserialized = from_bytes(to_bytes(data))
+        assert type(params_deserialized) is dict
+        assert params_deserialized == {"k": "v"}